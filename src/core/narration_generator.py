@@ -300,7 +300,7 @@ You MUST follow these requirements when generating the narration.
         if image_data and self.use_vision:
             # Encode image to base64
             import base64
-            image_base64 = base64.b64encode(image_data).decode('utf-8')
+            image_base64 = base64.b64encode(image_data).decode('ascii')
 
             # Create multi-modal message with image
             messages.append({
@@ -387,7 +387,7 @@ Use the previous slides' visual elements to create coherent transitions and avoi
             })
 
             # Add image
-            image_base64 = base64.b64encode(img['image_data']).decode('utf-8')
+            image_base64 = base64.b64encode(img['image_data']).decode('ascii')
             content.append({
                 "type": "image_url",
                 "image_url": {
@@ -426,7 +426,7 @@ Use the previous slides' visual elements to create coherent transitions and avoi
         if image_data and self.use_vision:
             # Encode image to base64
             import base64
-            image_base64 = base64.b64encode(image_data).decode('utf-8')
+            image_base64 = base64.b64encode(image_data).decode('ascii')
 
             # Determine media type (JPEG or PNG)
             media_type = "image/jpeg"  # Our slides are now JPEG from optimization
@@ -506,7 +506,7 @@ Use the previous slides' visual elements to create coherent transitions and avoi
             })
 
             # Add image
-            image_base64 = base64.b64encode(img['image_data']).decode('utf-8')
+            image_base64 = base64.b64encode(img['image_data']).decode('ascii')
             content.append({
                 "type": "image",
                 "source": {
@@ -639,7 +639,7 @@ The narration should:
                         "type": "text",
                         "text": f"\n[SLIDE {slide.slide_number} IMAGE: {slide.title}]"
                     })
-                    image_base64 = base64.b64encode(slide.image_data).decode('utf-8')
+                    image_base64 = base64.b64encode(slide.image_data).decode('ascii')
                     content.append({
                         "type": "image_url",
                         "image_url": {
@@ -681,7 +681,7 @@ The narration should:
                         "type": "text",
                         "text": f"\n[SLIDE {slide.slide_number} IMAGE: {slide.title}]"
                     })
-                    image_base64 = base64.b64encode(slide.image_data).decode('utf-8')
+                    image_base64 = base64.b64encode(slide.image_data).decode('ascii')
                     content.append({
                         "type": "image",
                         "source": {
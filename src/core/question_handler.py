@@ -3,12 +3,15 @@ Question Handler - Answers user questions during presentation using LLM.
 Maintains context of the current slide and presentation flow.
 """
 
-from typing import List, Optional
+import time
+from collections import deque
+from typing import Deque, Iterator, List, Optional
 from dataclasses import dataclass
 import openai
 
 from ..utils.config import Config
 from ..utils.benchmark import get_benchmark_tracker
+from ..utils.openai_limiter import estimate_tokens, get_rate_limiter
 from .slide_parser import Slide
 from .narration_generator import SlideNarration
 
@@ -24,7 +27,12 @@ class QuestionAnswer:
 
 class QuestionHandler:
     """Handle user questions during presentation."""
-    
+
+    # How long (seconds) a previously-sent slide image stays referenceable
+    # before we re-upload it on follow-up questions
+    VISION_REUSE_WINDOW = 120.0
+
+
     def __init__(self, model: Optional[str] = None):
         """
         Initialize question handler.
@@ -36,6 +44,20 @@ class QuestionHandler:
         self.model = model or Config.LLM_MODEL
         self.client = openai.OpenAI(api_key=Config.OPENAI_API_KEY)
         self.conversation_history: List[QuestionAnswer] = []
+        # Last slide whose image was uploaded, for follow-up dedup
+        self._last_vision_slide: Optional[int] = None
+        self._last_vision_ts: float = 0.0
+        # Pre-formatted tail of the history used in prompts; bounded so a long
+        # talk doesn't grow the per-question formatting cost
+        self._history_formatted: Deque[str] = deque(maxlen=3)
+
+        # Resolve the vision-capable model once instead of lowercasing the
+        # model name on every question
+        model_lower = self.model.lower()
+        self._vision_model = (
+            self.model if ("vision" in model_lower or "gpt-4" in model_lower)
+            else "gpt-4-turbo"
+        )
     
     def answer_question(
         self,
@@ -76,7 +98,7 @@ class QuestionHandler:
         )
         
         # Get answer from LLM (with optional image)
-        image_data = current_slide.image_data_compressed if (use_vision and current_slide.image_data_compressed) else None
+        image_data, prompt = self._resolve_vision_image(current_slide, use_vision, prompt)
 
         # Log vision usage
         if image_data:
@@ -102,16 +124,102 @@ class QuestionHandler:
         print(f"[BENCHMARK] QuestionHandler.answer_question: {duration:.2f}s (Q:{len(question)} chars, A:{len(answer)} chars)")
         
         # Store in conversation history
+        self._record_qa(question, answer, current_slide.slide_number)
+
+        return answer
+
+    def answer_question_stream(
+        self,
+        question: str,
+        current_slide: Slide,
+        current_narration: SlideNarration,
+        all_slides: List[Slide],
+        additional_context: Optional[str] = None,
+        use_vision: bool = True
+    ) -> Iterator[str]:
+        """
+        Answer a user question, yielding the answer incrementally as it is generated.
+
+        Streaming delivers the first tokens in a few hundred milliseconds instead
+        of waiting for the full answer, so callers can start TTS/display early.
+        The complete answer is recorded in conversation history once the stream
+        is exhausted.
+
+        Args:
+            question: User's question
+            current_slide: The slide being viewed
+            current_narration: The narration for current slide
+            all_slides: All slides in presentation
+            additional_context: Any additional context (notes, documents)
+            use_vision: Whether to include slide image in the prompt (default: True)
+
+        Yields:
+            Chunks of the answer text as they arrive
+        """
+        prompt = self._build_question_prompt(
+            question,
+            current_slide,
+            current_narration,
+            all_slides,
+            additional_context,
+            use_vision
+        )
+
+        image_data, prompt = self._resolve_vision_image(current_slide, use_vision, prompt)
+
+        chunks = []
+        for chunk in self._answer_openai_stream(prompt, image_data=image_data):
+            chunks.append(chunk)
+            yield chunk
+
+        # Store in conversation history once complete
+        self._record_qa(question, "".join(chunks).strip(), current_slide.slide_number)
+
+    def _record_qa(self, question: str, answer: str, slide_number: int) -> None:
+        """Append a Q&A pair to history and its formatted prompt tail."""
         qa = QuestionAnswer(
             question=question,
             answer=answer,
-            slide_number=current_slide.slide_number,
+            slide_number=slide_number,
             timestamp=0.0  # Will be set by caller
         )
         self.conversation_history.append(qa)
-        
-        return answer
-    
+        self._history_formatted.append(f"Q: {question}\nA: {answer}")
+
+    def _resolve_vision_image(
+        self,
+        current_slide: Slide,
+        use_vision: bool,
+        prompt: str
+    ) -> tuple:
+        """Decide whether to upload the slide image for this question.
+
+        Follow-up questions about the same slide within VISION_REUSE_WINDOW
+        skip the image upload (the model already saw it in the previous turn)
+        and instead get a textual pointer back to it, cutting hundreds of KB
+        of repeated upload per question.
+
+        Args:
+            current_slide: The slide being viewed
+            use_vision: Whether vision is enabled for this question
+            prompt: The already-built question prompt
+
+        Returns:
+            Tuple of (image bytes or None, possibly-prefixed prompt)
+        """
+        image_data = current_slide.image_data_compressed if (use_vision and current_slide.image_data_compressed) else None
+        if not image_data:
+            return None, prompt
+
+        now = time.monotonic()
+        if (current_slide.slide_number == self._last_vision_slide
+                and now - self._last_vision_ts < self.VISION_REUSE_WINDOW):
+            return None, "Refer to the slide image provided in the previous turn.\n\n" + prompt
+
+        self._last_vision_slide = current_slide.slide_number
+        self._last_vision_ts = now
+        return image_data, prompt
+
     def _build_question_prompt(
         self,
         question: str,
@@ -172,25 +280,17 @@ Provide ONLY the answer, without any meta-commentary."""
     
     def _format_conversation_history(self) -> str:
         """Format recent conversation history."""
-        if not self.conversation_history:
-            return "No previous questions."
-        
-        recent = self.conversation_history[-3:]  # Last 3 Q&A pairs
-        formatted = []
-        for qa in recent:
-            formatted.append(f"Q: {qa.question}\nA: {qa.answer}")
-        
-        return "\n\n".join(formatted)
+        return "\n\n".join(self._history_formatted) or "No previous questions."
     
-    def _answer_openai(self, prompt: str, image_data: Optional[bytes] = None) -> str:
-        """Answer using OpenAI with optional vision support.
+    def _build_messages(self, prompt: str, image_data: Optional[bytes] = None):
+        """Build the chat messages and pick the model for an answer request.
 
         Args:
             prompt: Text prompt
             image_data: Optional image bytes (JPEG/PNG) for vision models
 
         Returns:
-            Generated answer text
+            Tuple of (messages, model name)
         """
         messages = [
             {"role": "system", "content": "You are a helpful presentation assistant that answers questions about slide content."}
@@ -200,7 +300,7 @@ Provide ONLY the answer, without any meta-commentary."""
         if image_data:
             # Encode image to base64
             import base64
-            image_base64 = base64.b64encode(image_data).decode('utf-8')
+            image_base64 = base64.b64encode(image_data).decode('ascii')
 
             # Create multi-modal message with image
             messages.append({
@@ -220,8 +320,8 @@ Provide ONLY the answer, without any meta-commentary."""
                 ]
             })
 
-            # Use vision-capable model
-            model = self.model if "vision" in self.model.lower() or "gpt-4" in self.model.lower() else "gpt-4-turbo"
+            # Use vision-capable model (resolved once in __init__)
+            model = self._vision_model
         else:
             # Text-only message
             messages.append({
@@ -230,17 +330,51 @@ Provide ONLY the answer, without any meta-commentary."""
             })
             model = self.model
 
+        return messages, model
+
+    def _answer_openai(self, prompt: str, image_data: Optional[bytes] = None) -> str:
+        """Answer using OpenAI with optional vision support.
+
+        Args:
+            prompt: Text prompt
+            image_data: Optional image bytes (JPEG/PNG) for vision models
+
+        Returns:
+            Generated answer text
+        """
+        return "".join(self._answer_openai_stream(prompt, image_data=image_data)).strip()
+
+    def _answer_openai_stream(self, prompt: str, image_data: Optional[bytes] = None) -> Iterator[str]:
+        """Answer using OpenAI, yielding text deltas as they stream in.
+
+        Args:
+            prompt: Text prompt
+            image_data: Optional image bytes (JPEG/PNG) for vision models
+
+        Yields:
+            Answer text chunks
+        """
+        messages, model = self._build_messages(prompt, image_data=image_data)
+
+        # Stay under the account's RPM/TPM ceilings instead of eating 429s
+        get_rate_limiter().acquire(tokens=estimate_tokens(prompt, model))
+
         response = self.client.chat.completions.create(
             model=model,
             messages=messages,
             temperature=0.7,
-            max_tokens=500  # Shorter answers for questions
+            max_tokens=500,  # Shorter answers for questions
+            stream=True
         )
-        return response.choices[0].message.content.strip()
+        for chunk in response:
+            delta = chunk.choices[0].delta.content if chunk.choices else None
+            if delta:
+                yield delta
     
     def clear_history(self):
         """Clear conversation history."""
         self.conversation_history = []
+        self._history_formatted.clear()
     
     def get_history(self) -> List[QuestionAnswer]:
         """Get conversation history."""
@@ -24,6 +24,7 @@ class Slide:
     notes: str = ""
     image_data: Optional[bytes] = None  # Original high-res image
     image_data_compressed: Optional[bytes] = None  # Compressed for LLM
+    thumbnail_data: Optional[bytes] = None  # Small preview rendered in the same parse pass
 
     def to_dict(self) -> Dict:
         """Convert slide to dictionary."""
@@ -32,23 +33,26 @@ class Slide:
             "title": self.title,
             "content": self.content,
             "notes": self.notes,
-            "image_data": base64.b64encode(self.image_data).decode('utf-8') if self.image_data else None,
-            "image_data_compressed": base64.b64encode(self.image_data_compressed).decode('utf-8') if self.image_data_compressed else None,
+            "image_data": base64.b64encode(self.image_data).decode('ascii') if self.image_data else None,
+            "image_data_compressed": base64.b64encode(self.image_data_compressed).decode('ascii') if self.image_data_compressed else None,
+            "thumbnail_data": base64.b64encode(self.thumbnail_data).decode('ascii') if self.thumbnail_data else None,
             "has_image": self.image_data is not None
         }
-    
+
     @classmethod
     def from_dict(cls, data: Dict) -> 'Slide':
         """Create Slide from dictionary."""
         image_data = base64.b64decode(data['image_data']) if data.get('image_data') else None
         image_data_compressed = base64.b64decode(data['image_data_compressed']) if data.get('image_data_compressed') else None
+        thumbnail_data = base64.b64decode(data['thumbnail_data']) if data.get('thumbnail_data') else None
         return cls(
             slide_number=data['slide_number'],
             title=data['title'],
             content=data['content'],
             notes=data.get('notes', ""),
             image_data=image_data,
-            image_data_compressed=image_data_compressed
+            image_data_compressed=image_data_compressed,
+            thumbnail_data=thumbnail_data
         )
 
 
@@ -137,12 +141,18 @@ class SlideParser:
                     # Quality 85 provides good balance between quality and file size
                     image_data_compressed = pix.tobytes("jpeg", jpg_quality=85)
 
+                # Render the thumbnail in the same pass - re-opening the PDF
+                # later just for previews costs a full page parse per slide
+                pix_thumb = page.get_pixmap(matrix=fitz.Matrix(0.5, 0.5), alpha=False)
+                thumbnail_data = pix_thumb.tobytes("jpeg", jpg_quality=85)
+
                 slides.append(Slide(
                     slide_number=page_num,
                     title=title.strip(),
                     content=content.strip(),
                     image_data=image_data,
-                    image_data_compressed=image_data_compressed
+                    image_data_compressed=image_data_compressed,
+                    thumbnail_data=thumbnail_data
                 ))
         
         return slides
@@ -153,25 +163,28 @@ class SlideParser:
         prs = Presentation(file_path)
 
         for slide_num, slide in enumerate(prs.slides, start=1):
-            title = ""
             content_parts = []
             notes = ""
-            
-            # Extract title
-            if slide.shapes.title:
-                title = slide.shapes.title.text
-            
-            # Extract content from shapes
+
+            # Look up the title shape once; repeated slide.shapes.title access
+            # re-walks the shape tree XML on every call
+            title_shape = slide.shapes.title
+            title = title_shape.text if title_shape is not None else ""
+            title_shape_id = title_shape.shape_id if title_shape is not None else None
+
+            # Extract content from shapes in a single pass
             for shape in slide.shapes:
-                if hasattr(shape, "text") and shape.text:
-                    if shape != slide.shapes.title:
-                        content_parts.append(shape.text)
-            
-            # Extract notes
+                if shape.shape_id == title_shape_id:
+                    continue
+                text = getattr(shape, "text", None)
+                if text:
+                    content_parts.append(text)
+
+            # Extract notes (hoist the notes_slide lookup, also an XML walk)
             if slide.has_notes_slide:
-                notes_slide = slide.notes_slide
-                if notes_slide.notes_text_frame:
-                    notes = notes_slide.notes_text_frame.text
+                notes_text_frame = slide.notes_slide.notes_text_frame
+                if notes_text_frame:
+                    notes = notes_text_frame.text
             
             content = '\n'.join(content_parts)
             
@@ -10,16 +10,214 @@ import os
 warnings.filterwarnings('ignore', category=UserWarning)
 os.environ['PYTHONWARNINGS'] = 'ignore::UserWarning'
 
+import hashlib
+import itertools
+import shutil
+import threading
 from pathlib import Path
 from typing import Optional
 from dataclasses import dataclass
-import openai
-import soundfile as sf
-
 from ..utils.config import Config
 from ..utils.benchmark import get_benchmark_tracker
 
 
+# Qwen3-TTS model checkpoint used for local synthesis
+QWEN_MODEL_ID = "Qwen/Qwen3-TTS-12Hz-0.6B-CustomVoice"
+
+# Benchmark timer IDs must be unique per in-flight call, not per engine: the
+# engine is a shared singleton and generate_audio runs from several threads at
+# once, so id(self)-keyed timers would collide. next() on a count is atomic.
+_timer_seq = itertools.count()
+
+# Process-wide cache of loaded Qwen models keyed by (model_id, device, dtype).
+# Loading is a multi-GB, multi-second operation; every TTSEngine instance in
+# the same process shares one set of weights.
+_QWEN_CACHE: dict = {}
+_qwen_cache_lock = threading.Lock()
+
+
+def _link_or_copy(src: Path, dst: Path) -> None:
+    """Hardlink src to dst, copying instead when the link crosses devices."""
+    if dst.exists():
+        dst.unlink()
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+
+
+def _limit_cpu_threads() -> None:
+    """Cap PyTorch thread pools at the physical core count for CPU inference.
+
+    The defaults use the logical-CPU count, which oversubscribes SMT siblings
+    and thrashes L2 during GEMMs. Assumes 2-way SMT (the common case); the
+    env vars are setdefault so an operator override wins.
+    """
+    import torch
+
+    n = max(1, (os.cpu_count() or 2) // 2)
+    os.environ.setdefault("OMP_NUM_THREADS", str(n))
+    os.environ.setdefault("MKL_NUM_THREADS", str(n))
+    torch.set_num_threads(n)
+    try:
+        torch.set_num_interop_threads(max(1, n // 2))
+    except RuntimeError:
+        # Interop pool already started (e.g. a second engine in-process)
+        pass
+    torch.set_float32_matmul_precision("medium")
+
+
+def _select_qwen_device():
+    """Pick the best available device for local Qwen inference.
+
+    Tries CUDA first (verifying the build actually supports the GPU's SM
+    version with a tiny probe op - e.g. sm_120 cards fail here on older
+    PyTorch builds), then MPS, then CPU. PRESENTLM_TTS_DEVICE overrides
+    the selection entirely.
+    """
+    import torch
+
+    override = os.environ.get("PRESENTLM_TTS_DEVICE")
+    if override:
+        return torch.device(override)
+
+    if torch.cuda.is_available():
+        try:
+            # Probe: unsupported SM versions raise on the first kernel launch
+            torch.zeros(1, device="cuda")
+            return torch.device("cuda")
+        except Exception as e:
+            print(f"Warning: CUDA available but unusable ({e}), falling back")
+
+    if torch.backends.mps.is_available():
+        return torch.device("mps")
+
+    return torch.device("cpu")
+
+
+def _select_qwen_dtype(device):
+    """Pick the inference dtype for the Qwen decoder.
+
+    CPU inference is memory-bandwidth-bound, so bf16 halves bytes moved per
+    matmul when the hardware supports it natively; otherwise fp32 is kept to
+    avoid slow emulation.
+    """
+    import torch
+
+    if device.type != "cpu":
+        return torch.bfloat16
+    try:
+        if torch.backends.cpu.get_cpu_capability() in ("AVX512", "AMX"):
+            return torch.bfloat16
+    except AttributeError:
+        pass
+    return torch.float32
+
+
+def _quantize_qwen_linears(model, quantize: str):
+    """Replace decoder nn.Linear layers with bitsandbytes 8/4-bit variants.
+
+    The vocoder is left untouched - quantizing it introduces audible
+    artifacts for little bandwidth gain. No-op if bitsandbytes is missing.
+    """
+    try:
+        import bitsandbytes as bnb
+    except ImportError:
+        print("Warning: bitsandbytes not installed - skipping TTS quantization")
+        return model
+
+    import torch.nn as nn
+
+    linear_cls = bnb.nn.Linear8bitLt if quantize == "int8" else bnb.nn.Linear4bit
+
+    def replace(module, prefix=""):
+        for name, child in module.named_children():
+            qualified = f"{prefix}.{name}" if prefix else name
+            if "vocoder" in qualified.lower():
+                continue
+            if isinstance(child, nn.Linear):
+                quantized = linear_cls(
+                    child.in_features,
+                    child.out_features,
+                    bias=child.bias is not None
+                )
+                quantized.weight.data = child.weight.data
+                if child.bias is not None:
+                    quantized.bias.data = child.bias.data
+                setattr(module, name, quantized)
+            else:
+                replace(child, qualified)
+
+    replace(model)
+    return model
+
+
+def _compile_qwen_decoder(client, voice: str):
+    """Compile the AR decoder forward and warm it up.
+
+    The decoder runs once per generated code token, so Python/launch overhead
+    dominates small-batch latency. reduce-overhead mode captures CUDA graphs
+    for the steady-state decode step, removing per-token launch cost. Any
+    compile failure restores the eager forward and falls back - it's purely
+    an optimization.
+    """
+    import torch
+
+    original_forward = client.model.forward
+    try:
+        client.model.forward = torch.compile(
+            original_forward,
+            mode="reduce-overhead",
+            fullgraph=False
+        )
+        # Tiny warmup generation - same call shape as production synthesis -
+        # so compilation and graph capture happen at load time instead of on
+        # the first real slide
+        client.generate_custom_voice(
+            text=" ",
+            speaker=voice,
+            language="english",
+            non_streaming_mode=True,
+            max_new_tokens=4,
+        )
+    except Exception as e:
+        # Put the eager forward back so the fallback message matches the
+        # actual state and the failure isn't re-hit on the first slide
+        client.model.forward = original_forward
+        print(f"Warning: torch.compile on Qwen decoder failed, using eager: {e}")
+
+    return client
+
+
+def _load_qwen_model(model_id: str, device, torch_dtype, quantize: str = "none", voice: str = ""):
+    """Load a Qwen3-TTS model, reusing a cached instance when available."""
+    from qwen_tts.inference.qwen3_tts_model import Qwen3TTSModel
+
+    key = (model_id, str(device), str(torch_dtype), quantize)
+    with _qwen_cache_lock:
+        client = _QWEN_CACHE.get(key)
+        if client is None:
+            print(f"Loading Qwen3-TTS model...")
+            client = Qwen3TTSModel.from_pretrained(
+                model_id,
+                torch_dtype=torch_dtype,
+                low_cpu_mem_usage=False
+            )
+            if quantize != "none":
+                client.model = _quantize_qwen_linears(client.model, quantize)
+            client.model = client.model.to(device)
+
+            if hasattr(client.model, 'config'):
+                client.model.config.use_cache = True
+
+            if device.type == "cuda":
+                client = _compile_qwen_decoder(client, voice)
+
+            _QWEN_CACHE[key] = client
+            print(f"✅ Qwen3-TTS model loaded successfully on {device}")
+        return client
+
+
 @dataclass
 class AudioSegment:
     """Represents an audio segment for a slide."""
@@ -51,48 +249,60 @@ class AudioSegment:
 class TTSEngine:
     """Text-to-Speech conversion engine."""
     
-    def __init__(self, provider: Optional[str] = None, voice: Optional[str] = None):
+    def __init__(
+        self,
+        provider: Optional[str] = None,
+        voice: Optional[str] = None,
+        quantize: str = "none"
+    ):
         """
         Initialize TTS engine.
-        
+
         Args:
             provider: TTS provider (openai, qwen)
             voice: Voice name/ID (for OpenAI: alloy, echo, fable, onyx, nova, shimmer;
                    for Qwen: speaker names like 'en-Female1', 'en-Male1', etc.)
+            quantize: Weight quantization for the local Qwen decoder
+                      ("none", "int8", "int4"); requires bitsandbytes
         """
         self.provider = provider or Config.TTS_PROVIDER
         self.voice = voice or Config.TTS_VOICE
-        
+
+        generators = {
+            "openai": self._generate_openai,
+            "qwen": self._generate_qwen,
+        }
+        if self.provider not in generators:
+            raise ValueError(f"Unsupported TTS provider: {self.provider}. Supported: openai, qwen")
+        # Resolved once here so generate_audio does a bound-method call
+        # instead of re-checking the provider string per synthesis
+        self._generate = generators[self.provider]
+
         if self.provider == "openai":
+            # Provider libs are imported lazily so an openai-only process
+            # never pays for torch/BLAS import and vice-versa
+            import openai
             self.client = openai.OpenAI(api_key=Config.OPENAI_API_KEY)
         elif self.provider == "qwen":
-            # Load Qwen3-TTS model locally
-            from qwen_tts.inference.qwen3_tts_model import Qwen3TTSModel
-            import torch
-
-            print(f"Loading Qwen3-TTS model...")
-
-            # Force CPU - RTX 5070 sm_120 not supported by PyTorch
-            self.device = torch.device("cpu")
+            # Load Qwen3-TTS model locally (cached across engine instances)
+            self.device = _select_qwen_device()
 
             print(f"Using device: {self.device}")
 
-            # Load with explicit CPU device
-            self.client = Qwen3TTSModel.from_pretrained(
-                "Qwen/Qwen3-TTS-12Hz-0.6B-CustomVoice",
-                torch_dtype=torch.float32,
-                low_cpu_mem_usage=False
-            )
+            if self.device.type == "cpu":
+                _limit_cpu_threads()
 
-            # Move model to CPU explicitly
-            self.client.model = self.client.model.to(self.device)
+            self.torch_dtype = _select_qwen_dtype(self.device)
+            self.client = _load_qwen_model(QWEN_MODEL_ID, self.device, self.torch_dtype, quantize, self.voice)
 
-            if hasattr(self.client.model, 'config'):
-                self.client.model.config.use_cache = True
+            # Inference-only engine: disabling autograd globally removes
+            # per-op view tracking even outside the inference_mode blocks
+            import torch
+            torch.set_grad_enabled(False)
 
-            print(f"✅ Qwen3-TTS model loaded successfully on {self.device}")
-        else:
-            raise ValueError(f"Unsupported TTS provider: {self.provider}. Supported: openai, qwen")
+            # Reusable conversion buffers for _write_pcm16, grown on demand
+            self._pcm_scratch = None
+            self._int16_scratch = None
 
     def generate_audio(
         self,
@@ -111,47 +321,88 @@ class TTSEngine:
         Returns:
             AudioSegment with metadata
         """
-        # Start benchmarking
-        benchmark = get_benchmark_tracker()
-        timer_id = f"generate_audio_{id(self)}"
-        benchmark.start_timer(timer_id)
-        
-        if self.provider == "openai":
-            segment = self._generate_openai(text, output_path, speed)
-        elif self.provider == "qwen":
-            segment = self._generate_qwen(text, output_path, speed)
+        # Start benchmarking (skipped entirely when disabled - the tracker
+        # call, metadata dict and print are measurable on short texts)
+        benchmark_enabled = Config.BENCHMARK_ENABLED
+        if benchmark_enabled:
+            benchmark = get_benchmark_tracker()
+            timer_id = f"generate_audio_{next(_timer_seq)}"
+            benchmark.start_timer(timer_id)
+
+        # Content-addressed cache: identical (provider, voice, speed, text)
+        # requests reuse the previously synthesized file instead of paying
+        # for TTS again (common when regenerating a deck after small edits)
+        cache_key = hashlib.blake2b(
+            f"{self.provider}|{self.voice}|{speed}|{text}".encode(),
+            digest_size=16
+        ).hexdigest()
+        cached_path = Config.TTS_CACHE_DIR / f"{cache_key}{output_path.suffix}"
+
+        cache_hit = cached_path.exists()
+        if cache_hit:
+            _link_or_copy(cached_path, output_path)
+            segment = AudioSegment(
+                slide_number=0,  # Will be set by caller
+                audio_path=output_path,
+                duration=self._audio_duration(cached_path, text, speed),
+                text=text
+            )
+            print(f"♻️  TTS cache hit for {output_path.name}")
         else:
-            raise ValueError(f"Unsupported TTS provider: {self.provider}. Supported: openai, qwen")
+            segment = self._generate(text, output_path, speed)
+
+        if not cache_hit:
+            _link_or_copy(output_path, cached_path)
 
         # End benchmarking
-        duration = benchmark.end_timer(
-            timer_id,
-            component="TTSEngine",
-            operation="generate_audio",
-            metadata={
-                "provider": self.provider,
-                "voice": self.voice,
-                "text_length": len(text),
-                "word_count": len(text.split()),
-                "audio_duration": segment.duration
-            }
-        )
-        
-        print(f"[BENCHMARK] TTSEngine.generate_audio: {duration:.2f}s ({len(text.split())} words, {segment.duration:.1f}s audio)")
-        
+        if benchmark_enabled:
+            word_count = len(text.split())
+            duration = benchmark.end_timer(
+                timer_id,
+                component="TTSEngine",
+                operation="generate_audio",
+                metadata={
+                    "provider": self.provider,
+                    "voice": self.voice,
+                    "text_length": len(text),
+                    "word_count": word_count,
+                    "audio_duration": segment.duration,
+                    "cache_hit": cache_hit
+                }
+            )
+
+            print(f"[BENCHMARK] TTSEngine.generate_audio: {duration:.2f}s ({word_count} words, {segment.duration:.1f}s audio)")
+
         return segment
-    
+
+    def _audio_duration(self, audio_path: Path, text: str, speed: float) -> float:
+        """Read the duration of an audio file, estimating from word count if unreadable."""
+        try:
+            import soundfile as sf
+            return sf.info(str(audio_path)).duration
+        except Exception:
+            # Same ~150 wpm estimate used when OpenAI omits duration
+            return (len(text.split()) / 150) * 60 / speed
+
     def _generate_openai(self, text: str, output_path: Path, speed: float) -> AudioSegment:
         """Generate audio using OpenAI TTS."""
-        response = self.client.audio.speech.create(
+        from ..utils.openai_limiter import estimate_tokens, get_rate_limiter
+
+        # Pace against the shared account-level limiter before the call -
+        # the UI and batch_generate both fan requests out across threads,
+        # and unthrottled bursts trip 429s and retry stalls
+        get_rate_limiter().acquire(tokens=estimate_tokens(text))
+
+        # Stream response bytes straight to disk as they arrive instead of
+        # buffering the whole download before writing
+        with self.client.audio.speech.with_streaming_response.create(
             model="tts-1-hd",  # or "tts-1" for faster/cheaper
             voice=self.voice,  # alloy, echo, fable, onyx, nova, shimmer
             input=text,
-            speed=speed
-        )
-        
-        # Save audio file
-        response.stream_to_file(output_path)
+            speed=speed,
+            response_format="mp3"  # players and saved filenames expect audio/mpeg
+        ) as response:
+            response.stream_to_file(output_path)
         
         # Estimate duration (OpenAI doesn't provide it directly)
         word_count = len(text.split())
@@ -172,8 +423,13 @@ class TTSEngine:
             # Detect language from text
             language = self._detect_language(text)
 
-            # Use inference mode for faster generation
-            with torch.inference_mode():
+            # Use inference mode for faster generation; autocast keeps
+            # accelerator matmuls in bf16 regardless of parameter dtype
+            with torch.inference_mode(), torch.autocast(
+                device_type=self.device.type,
+                dtype=torch.bfloat16,
+                enabled=self.device.type != "cpu"
+            ):
                 # Generate audio using Qwen3-TTS with optimizations
                 audio_arrays, sample_rate = self.client.generate_custom_voice(
                     text=text,
@@ -194,7 +450,7 @@ class TTSEngine:
                 raise ValueError("No audio generated")
 
             # Save audio file
-            sf.write(str(output_path), audio, sample_rate)
+            self._write_pcm16(output_path, audio, sample_rate)
 
             # Calculate actual duration
             duration = len(audio) / sample_rate
@@ -208,15 +464,65 @@ class TTSEngine:
         except Exception as e:
             raise ValueError(f"Qwen TTS generation failed: {e}")
 
+    def _write_pcm16(self, output_path: Path, audio, sample_rate: int) -> None:
+        """Write a float waveform as 16-bit PCM, quantizing in NumPy first.
+
+        sf.write would quantize to PCM_16 anyway, but pre-converting halves
+        the bytes handed across the libsndfile boundary. The scale/clip/cast
+        runs in persistent scratch buffers (grown on demand, reused across
+        slides) so batch runs don't malloc/free megabytes per call.
+        """
+        import numpy as np
+        import soundfile as sf
+
+        n = len(audio)
+        if self._pcm_scratch is None or len(self._pcm_scratch) < n:
+            # Start at one minute of 48kHz audio; grow to fit longer slides
+            size = max(n, 48000 * 60)
+            self._pcm_scratch = np.empty(size, dtype=np.float32)
+            self._int16_scratch = np.empty(size, dtype=np.int16)
+
+        pcm = self._pcm_scratch[:n]
+        np.multiply(audio, 32767.0, out=pcm)
+        np.clip(pcm, -32768.0, 32767.0, out=pcm)
+        out = self._int16_scratch[:n]
+        np.copyto(out, pcm, casting="unsafe")
+        if output_path.suffix.lower() in (".wav", ".flac"):
+            sf.write(str(output_path), out, sample_rate, subtype="PCM_16")
+        else:
+            # MP3 (the default output format) has no PCM subtypes and
+            # libsndfile rejects the combination; its default subtype is
+            # fine, and the int16 input already halves the bytes handed
+            # across the FFI boundary either way
+            sf.write(str(output_path), out, sample_rate)
+
     def _detect_language(self, text: str) -> str:
         """Simple language detection for Qwen TTS."""
-        # Check for Chinese characters
-        if any('\u4e00' <= char <= '\u9fff' for char in text):
+        # Check for Chinese characters. Short strings stay on the generator
+        # (encode overhead dominates); longer narrations use a vectorized
+        # codepoint range check instead of a per-character Python loop.
+        if len(text) < 64:
+            if any('\u4e00' <= char <= '\u9fff' for char in text):
+                return 'chinese'
+            return 'english'
+
+        import numpy as np
+
+        codepoints = np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32)
+        if ((codepoints >= 0x4e00) & (codepoints <= 0x9fff)).any():
             return 'chinese'
         # Default to English
         return 'english'
 
 
+    # Micro-batch size for local Qwen inference; keeps padding waste and
+    # memory bounded while still amortizing per-call model overhead
+    QWEN_BATCH_SIZE = 8
+
+    # Concurrent in-flight OpenAI TTS requests; wall time is dominated by
+    # network RTT, so overlapping requests gives near-linear speedup
+    OPENAI_MAX_CONCURRENT = 8
+
     def batch_generate(
         self,
         texts: list[tuple[str, Path]],
@@ -224,18 +530,129 @@ class TTSEngine:
     ) -> list[AudioSegment]:
         """
         Generate audio for multiple texts.
-        
+
+        For the local Qwen provider, texts are grouped by detected language and
+        synthesized in micro-batches so the model's matmuls are shared across
+        the batch instead of paying full per-call overhead per slide. The
+        OpenAI provider stays on per-request generation (network-bound).
+
         Args:
             texts: List of (text, output_path) tuples
             speed: Speech speed multiplier
-            
+
         Returns:
-            List of AudioSegment objects
+            List of AudioSegment objects, in input order
         """
+        if self.provider == "qwen":
+            return self._batch_generate_qwen(texts, speed)
+        if self.provider == "openai":
+            return self._batch_generate_openai(texts, speed)
+
         segments = []
         for idx, (text, output_path) in enumerate(texts, start=1):
             segment = self.generate_audio(text, output_path, speed)
             segment.slide_number = idx
             segments.append(segment)
-        
+
+        return segments
+
+    def _batch_generate_openai(
+        self,
+        texts: list[tuple[str, Path]],
+        speed: float
+    ) -> list[AudioSegment]:
+        """Generate audio for multiple texts with concurrent OpenAI requests.
+
+        Each request is a blocking HTTPS round-trip, so a thread pool overlaps
+        up to OPENAI_MAX_CONCURRENT of them instead of serializing N RTTs.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        max_workers = min(self.OPENAI_MAX_CONCURRENT, max(1, len(texts)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(self.generate_audio, text, output_path, speed)
+                for text, output_path in texts
+            ]
+            segments = []
+            for idx, future in enumerate(futures, start=1):
+                segment = future.result()
+                segment.slide_number = idx
+                segments.append(segment)
+
+        return segments
+
+    def _batch_generate_qwen(
+        self,
+        texts: list[tuple[str, Path]],
+        speed: float
+    ) -> list[AudioSegment]:
+        """Generate audio for multiple texts with batched Qwen3-TTS inference."""
+        import torch
+
+        benchmark_enabled = Config.BENCHMARK_ENABLED
+        if benchmark_enabled:
+            benchmark = get_benchmark_tracker()
+            timer_id = f"batch_generate_{next(_timer_seq)}"
+            benchmark.start_timer(timer_id)
+
+        segments: list = [None] * len(texts)
+
+        # Group inputs by detected language - Qwen takes one language per call
+        by_language: dict[str, list[int]] = {}
+        for idx, (text, _) in enumerate(texts):
+            by_language.setdefault(self._detect_language(text), []).append(idx)
+
+        for language, indices in by_language.items():
+            # Longest-first within each language so micro-batches hold
+            # similar-length texts - padding waste scales with the length
+            # spread inside a batch. Output order is unaffected: segments
+            # are scattered back by original index below.
+            indices.sort(key=lambda i: -len(texts[i][0]))
+            for start in range(0, len(indices), self.QWEN_BATCH_SIZE):
+                batch_indices = indices[start:start + self.QWEN_BATCH_SIZE]
+                batch_texts = [texts[i][0] for i in batch_indices]
+
+                with torch.inference_mode(), torch.autocast(
+                    device_type=self.device.type,
+                    dtype=torch.bfloat16,
+                    enabled=self.device.type != "cpu"
+                ):
+                    audio_arrays, sample_rate = self.client.generate_custom_voice(
+                        text=batch_texts,
+                        speaker=self.voice,
+                        language=language,
+                        non_streaming_mode=True,
+                        do_sample=True,
+                        top_k=20,
+                        top_p=0.95,
+                        temperature=0.7,
+                        max_new_tokens=2048,
+                    )
+
+                for audio, idx in zip(audio_arrays, batch_indices):
+                    output_path = texts[idx][1]
+                    self._write_pcm16(output_path, audio, sample_rate)
+                    segments[idx] = AudioSegment(
+                        slide_number=idx + 1,
+                        audio_path=output_path,
+                        duration=len(audio) / sample_rate,
+                        text=texts[idx][0]
+                    )
+
+        if benchmark_enabled:
+            duration = benchmark.end_timer(
+                timer_id,
+                component="TTSEngine",
+                operation="batch_generate",
+                metadata={
+                    "provider": self.provider,
+                    "voice": self.voice,
+                    "num_texts": len(texts),
+                    "batch_size": self.QWEN_BATCH_SIZE
+                }
+            )
+
+            print(f"[BENCHMARK] TTSEngine.batch_generate: {duration:.2f}s for {len(texts)} texts (batched)")
+
         return segments
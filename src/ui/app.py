@@ -4,7 +4,11 @@ Interactive presentation viewer with AI narration and Q&A.
 """
 
 import base64
-import json
+import gc
+import hashlib
+import os
+import queue
+import shutil
 import sys
 import time
 import threading
@@ -13,52 +17,160 @@ from pathlib import Path
 
 import streamlit as st
 import streamlit.components.v1 as components
-from reportlab.lib.pagesizes import letter
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Image as RLImage, PageBreak
-from reportlab.lib.enums import TA_CENTER, TA_LEFT
-from PIL import Image as PILImage
+
+try:
+    from streamlit_autorefresh import st_autorefresh
+except ImportError:
+    # Optional: without it the UI only picks up progress on user interaction
+    st_autorefresh = None
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-# Thread-safe storage for audio generation progress (not used anymore, using files instead)
-_audio_generation_lock = threading.Lock()
-_audio_generation_data = {}
+# Rerun cycles churn allocations against the large session-state lists
+# (slide images, narrations, segments), and the cyclic collector's pauses
+# land mid-render. Refcounting still frees the app's data promptly - it is
+# all acyclic dataclasses/lists - so turn the collector off and sweep
+# explicitly at the two deck-load points where garbage actually piles up.
+gc.disable()
+
+@st.cache_resource
+def get_audio_state(timestamp: str) -> dict:
+    """Shared audio-generation state for one processing session.
+
+    cache_resource makes the dict process-global, so the background TTS
+    thread and Streamlit reruns coordinate through memory instead of
+    round-tripping JSON through the filesystem on every slide. The disk
+    progress file is kept only as a crash-recovery snapshot on completion.
+    """
+    return {
+        "ready": [],
+        "segments": [],
+        "complete": False,
+        "lock": threading.Lock(),
+    }
+
+@st.cache_data(show_spinner=False)
+def get_saved_presentation_index(dir_mtime_ns: int) -> list:
+    """Saved-presentation index, cached until the data directory changes.
+
+    Keyed on the directory mtime: saving or deleting a deck touches the
+    directory and invalidates the cache, while plain reruns reuse the parsed
+    index instead of rescanning metadata JSON. Timestamps are pre-formatted
+    here so the render loop does no datetime parsing.
+    """
+    from datetime import datetime
+
+    presentations = get_saved_presentations(Config.DATA_DIR)
+    for pres in presentations:
+        timestamp_str = pres.get('timestamp', '')
+        display = timestamp_str
+        if timestamp_str:
+            try:
+                dt = datetime.strptime(timestamp_str, "%Y%m%d_%H%M%S")
+                display = dt.strftime("%Y-%m-%d %H:%M")
+            except ValueError:
+                pass
+        pres['timestamp_display'] = display
+    return presentations
+
+@st.cache_resource
+def get_pdf_executor():
+    """Background workers for PDF export generation.
+
+    The first export of a large deck takes seconds of ReportLab/PIL work;
+    running it off the main thread keeps reruns responsive while the
+    download button waits on the future.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    return ThreadPoolExecutor(max_workers=2, thread_name_prefix="pdf_export")
+
+@st.cache_resource
+def get_tts_lock() -> threading.Lock:
+    """Process-wide lock serializing TTS synthesis.
+
+    Two concurrent uploads would otherwise invoke the (single, shared) TTS
+    model at the same time - thrashing GPU memory on the qwen path only to
+    be serialized by CUDA anyway.
+    """
+    return threading.Lock()
+
+@st.cache_resource
+def get_tts_engine(voice: str):
+    """Shared TTSEngine instance per voice, reused across sessions and reruns."""
+    from src.core import TTSEngine
+    return TTSEngine(voice=voice)
+
+@st.cache_resource
+def load_audio_segment(audio_path: Path, slide_number: int):
+    """Rebuild an AudioSegment for an audio file already on disk.
+
+    cache_resource is process-global, so repeated reruns (and concurrent
+    sessions viewing the same saved deck) share one instance per file
+    instead of reconstructing it each time. Audio files are timestamp-named
+    and never rewritten, so the path alone is a stable cache key.
+    """
+    from src.core import AudioSegment
+    return AudioSegment(
+        audio_path=audio_path,
+        duration=0,
+        text="",
+        slide_number=slide_number
+    )
 
 def get_audio_progress_file(timestamp: str) -> Path:
     """Get the path to the audio progress file for a session."""
-    return Config.DATA_DIR / f"{timestamp}_audio_progress.json"
+    return Config.DATA_DIR / f"{timestamp}_audio_progress.bin"
+
+def pack_progress(ready: list, complete: bool) -> bytes:
+    """Pack progress as one complete byte, a 2-byte count, then a ready bitmap.
+
+    A 100-slide deck fits in 16 bytes; encoding/decoding is bit twiddling
+    with no parser involved.
+    """
+    payload = bytearray(3 + (len(ready) + 7) // 8)
+    payload[0] = 1 if complete else 0
+    payload[1:3] = len(ready).to_bytes(2, "little")
+    for idx, flag in enumerate(ready):
+        if flag:
+            payload[3 + idx // 8] |= 1 << (idx % 8)
+    return bytes(payload)
+
+def unpack_progress(payload: bytes) -> dict:
+    """Inverse of pack_progress; returns the same dict shape the JSON had."""
+    count = int.from_bytes(payload[1:3], "little")
+    ready = [bool(payload[3 + idx // 8] & (1 << (idx % 8))) for idx in range(count)]
+    return {'ready': ready, 'complete': bool(payload[0])}
 
 def save_audio_progress(timestamp: str, ready: list, complete: bool):
-    """Save audio generation progress to disk."""
+    """Save audio generation progress to disk.
+
+    Written to a sibling temp file and swapped in with os.replace: the
+    rename is atomic within a directory, so a reader racing the writer
+    sees either the previous snapshot or the new one, never a truncated
+    file.
+    """
     progress_file = get_audio_progress_file(timestamp)
-    save_json({
-        'ready': ready,
-        'complete': complete
-    }, progress_file)
+    tmp_file = progress_file.with_name(progress_file.name + ".tmp")
+    tmp_file.write_bytes(pack_progress(ready, complete))
+    os.replace(tmp_file, progress_file)
 
 def load_audio_progress(timestamp: str):
     """Load audio generation progress from disk."""
     progress_file = get_audio_progress_file(timestamp)
-    if progress_file.exists():
-        try:
-            data = load_json(progress_file)
-            return data
-        except (json.JSONDecodeError, ValueError) as e:
-            # Silently delete corrupted files
-            progress_file.unlink()
-            return None
-    return None
-
-from src.core import (
-    NarrationGenerator,
-    QuestionHandler,
-    SlideParser,
-    STTEngine,
-    TTSEngine,
-)
+    # EAFP: a single open() instead of an exists() stat followed by an open
+    try:
+        return unpack_progress(progress_file.read_bytes())
+    except FileNotFoundError:
+        return None
+    except (IndexError, ValueError):
+        # Silently delete corrupted/truncated files
+        progress_file.unlink(missing_ok=True)
+        return None
+
+# src.core pulls in PyMuPDF, python-pptx and the OpenAI client at import
+# time; defer it to the functions that actually parse/ask/synthesize so
+# app startup and plain reruns skip those imports entirely
 from src.utils import (
     Config,
     get_benchmark_tracker,
@@ -68,8 +180,7 @@ from src.utils import (
     reset_benchmark_tracker,
     sanitize_filename,
     save_presentation_data,
-    save_json,
-    load_json,
+    save_msgpack,
 )
 
 
@@ -90,6 +201,14 @@ if 'is_paused' not in st.session_state:
     st.session_state.is_paused = False
 if 'audio_ready' not in st.session_state:
     st.session_state.audio_ready = []
+if 'audio_ready_count' not in st.session_state:
+    # Running count of True flags in audio_ready, so the progress bar
+    # reads one int per rerun instead of summing the whole list
+    st.session_state.audio_ready_count = 0
+if 'audio_ready_version' not in st.session_state:
+    # Bumped whenever an audio_ready flag flips; lets the slide selector
+    # compare one int per rerun instead of hashing the whole flag list
+    st.session_state.audio_ready_version = 0
 if 'audio_generation_complete' not in st.session_state:
     st.session_state.audio_generation_complete = False
 if 'generating_audio' not in st.session_state:
@@ -125,66 +244,239 @@ if Config.TTS_PROVIDER == "qwen" and not st.session_state.qwen_preloaded:
     with st.spinner("Loading Qwen3-TTS model (first time only)..."):
         try:
             print("Pre-loading Qwen3-TTS model at app startup...")
-            # Create a dummy TTS engine to trigger model loading
-            _dummy_tts = TTSEngine()
+            # Warm the shared engine cache so generation reuses this instance
+            get_tts_engine(Config.TTS_VOICE)
             st.session_state.qwen_preloaded = True
             print("✅ Qwen3-TTS model pre-loaded successfully")
         except Exception as e:
             print(f"Warning: Could not pre-load Qwen3-TTS: {e}")
             # Don't fail the app, just log the warning
 
-def main():
-    """Main application."""
+# Static HTML/CSS blocks, hoisted to module level so reruns reference one
+# interned string instead of rebuilding multi-KB literals. They must still be
+# emitted on every rerun - Streamlit drops elements that aren't re-declared,
+# so gating the st.markdown call itself behind a flag or cache would strip
+# the styling after the first interaction.
+
+# The footer's two icons are inlined as SVGs (Font Awesome free paths, a few
+# hundred bytes) instead of pulling the ~80 KB Font Awesome stylesheet plus
+# webfont from a CDN on the critical rendering path.
+_BOOK_ICON_SVG = (
+    '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 448 512" '
+    'width="18" height="18" fill="currentColor" aria-hidden="true">'
+    '<path d="M96 0C43 0 0 43 0 96V416c0 53 43 96 96 96H384h32c17.7 0 32-14.3 '
+    '32-32s-14.3-32-32-32V384c17.7 0 32-14.3 32-32V32c0-17.7-14.3-32-32-32H384 '
+    '96zm0 384H352v64H96c-17.7 0-32-14.3-32-32s14.3-32 32-32zm32-240c0-8.8 '
+    '7.2-16 16-16H336c8.8 0 16 7.2 16 16s-7.2 16-16 16H144c-8.8 0-16-7.2-16-16zm16 '
+    '48H336c8.8 0 16 7.2 16 16s-7.2 16-16 16H144c-8.8 0-16-7.2-16-16s7.2-16 16-16z"/>'
+    '</svg>'
+)
 
-    st.markdown(
-        """
-        <link
-          rel="stylesheet"
-          href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.5.1/css/all.min.css"
-          integrity="sha512-DTOQO9RWCH3ppGqcWaEA1BIZOC6xxalwEsw9c2QQeAIftl+Vegovlnee1c9QX4TctnWMn13TZye+giMm8e2LwA=="
-          crossorigin="anonymous"
-          referrerpolicy="no-referrer"
-        />
-        """,
-        unsafe_allow_html=True
-    )
+_GITHUB_ICON_SVG = (
+    '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 496 512" '
+    'width="18" height="18" fill="currentColor" aria-hidden="true">'
+    '<path d="M165.9 397.4c0 2-2.3 3.6-5.2 3.6-3.3.3-5.6-1.3-5.6-3.6 0-2 '
+    '2.3-3.6 5.2-3.6 3-.3 5.6 1.3 5.6 3.6zm-31.1-4.5c-.7 2 1.3 4.3 4.3 4.9 '
+    '2.6 1 5.6 0 6.2-2s-1.3-4.3-4.3-5.2c-2.6-.7-5.5.3-6.2 2.3zm44.2-1.7c-2.9.7-4.9 '
+    '2.6-4.6 4.9.3 2 2.9 3.3 5.9 2.6 2.9-.7 4.9-2.6 4.6-4.6-.3-1.9-3-3.2-5.9-2.9zM244.8 '
+    '8C106.1 8 0 113.3 0 252c0 110.9 69.8 205.8 169.5 239.2 12.8 2.3 17.3-5.6 17.3-12.1 '
+    '0-6.2-.3-40.4-.3-61.4 0 0-70 15-84.7-29.8 0 0-11.4-29.1-27.8-36.6 0 0-22.9-15.7 '
+    '1.6-15.4 0 0 24.9 2 38.6 25.8 21.9 38.6 58.6 27.5 72.9 20.9 2.3-16 8.8-27.1 '
+    '16-33.7-55.9-6.2-112.3-14.3-112.3-110.5 0-27.5 7.6-41.3 23.6-58.9-2.6-6.5-11.1-33.3 '
+    '2.6-67.9 20.9-6.5 69 27 69 27 20-5.6 41.5-8.5 62.8-8.5s42.8 2.9 62.8 8.5c0 0 '
+    '48.1-33.6 69-27 13.7 34.7 5.2 61.4 2.6 67.9 16 17.7 25.8 31.5 25.8 58.9 0 96.5-58.9 '
+    '104.2-114.8 110.5 9.2 7.9 17 22.9 17 46.4 0 33.7-.3 75.4-.3 83.6 0 6.5 4.6 14.4 '
+    '17.3 12.1C428.2 457.8 496 362.9 496 252 496 113.3 389.9 8 244.8 8z"/>'
+    '</svg>'
+)
 
+_FOOTER_HTML = f"""
+<div style="
+    display: flex;
+    flex-direction: column;
+    align-items: center;
+    gap: 0.4rem;
+">
+    <div style="font-size: 1.2rem; display: flex; align-items: center;">
+        <a href="https://presentlm.github.io/PresentLM/"
+           target="_blank"
+           style="margin-right: 0.75rem; color: inherit;"
+           title="Documentation">
+            {_BOOK_ICON_SVG}
+        </a>
+        <a href="https://github.com/PresentLM/PresentLM"
+           target="_blank"
+           style="color: inherit;"
+           title="GitHub">
+            {_GITHUB_ICON_SVG}
+        </a>
+    </div>
+    <div style="font-size: 0.75rem; color: #6b7280;">
+        © 2026 PresentLM. All rights reserved.
+    </div>
+</div>
+"""
+
+# Compact toolbar / viewport-fitted layout for the presentation page
+_PRESENTATION_CSS = """
+<style>
+    /* Hide default Streamlit elements */
+    #MainMenu {visibility: hidden;}
+    header {visibility: hidden;}
+    footer {visibility: hidden;}
+    
+    /* Make body fit viewport exactly */
+    html, body {
+        height: 100vh;
+        overflow: hidden !important;
+    }
+    
+    [data-testid="stAppViewContainer"] {
+        height: 100vh;
+        overflow-y: auto;
+        overflow-x: hidden;
+    }
+    
+    /* Main container - constrain to viewport */
+    .block-container {
+        padding: 0.2rem 0.4rem;
+        max-width: 100%;
+        min-height: 100vh;
+        max-height: 100vh;
+    }
+    
+    /* Reduce all vertical spacing */
+    .element-container {
+        margin-bottom: 0.08rem;
+    }
+    
+    div[data-testid="stVerticalBlock"] > div {
+        gap: 0.08rem;
+    }
+    
+    /* Compact buttons */
+    .stButton button {
+        padding: 0.15rem 0.35rem;
+        font-size: 0.75rem;
+        height: 1.8rem;
+        line-height: 1;
+    }
+    
+    /* Hide the hidden trigger buttons completely and remove their space
+       (auto_advance keys carry the slide index, hence the prefix match) */
+    .st-key-home_button,
+    .st-key-answer_audio_done,
+    div[class*="st-key-auto_advance_"] {
+        display: none !important;
+        height: 0 !important;
+        margin: 0 !important;
+        padding: 0 !important;
+        visibility: hidden !important;
+    }
+    
+    /* Compact selectbox */
+    div[data-baseweb="select"] {
+        margin-bottom: 0.05rem;
+        min-height: 28px;
+    }
+    
+    div[data-baseweb="select"] > div {
+        min-height: 28px;
+        font-size: 0.75rem;
+    }
+    
+    /* Compact expander */
+    .streamlit-expanderHeader {
+        font-size: 0.7rem;
+        padding: 0.15rem 0.35rem;
+        font-weight: 500;
+        min-height: 26px;
+    }
+    
+    .streamlit-expanderContent {
+        padding: 0.25rem 0.4rem;
+        max-height: 8vh;
+        overflow-y: auto;
+        font-size: 0.7rem;
+        line-height: 1.3;
+    }
+    
+    /* Slide image - use viewport-relative sizing */
+    .stImage {
+        max-height: 60vh;
+        min-height: 200px;
+        object-fit: contain;
+        display: flex;
+        align-items: center;
+        justify-content: center;
+        margin: 0.1rem 0;
+    }
+    
+    .stImage img {
+        max-height: 50vh;
+        height: auto;
+        width: auto;
+        max-width: 100%;
+        object-fit: contain;
+    }
+    
+    /* Compact audio player */
+    audio {
+        height: 28px;
+    }
+    
+    /* Compact horizontal dividers */
+    hr {
+        margin: 0.1rem 0;
+        border-width: 0.5px;
+    }
+    
+    /* Compact download button */
+    .stDownloadButton button {
+        padding: 0.15rem 0.35rem;
+        font-size: 0.75rem;
+        height: 1.8rem;
+        line-height: 1;
+    }
+    
+    /* Reduce gap between columns */
+    div[data-testid="column"] {
+        padding: 0 0.1rem;
+    }
+    
+    /* Compact progress bar */
+    .stProgress {
+        height: 0.15rem;
+    }
+    
+    /* Compact info/warning boxes */
+    .stAlert {
+        padding: 0.15rem 0.35rem;
+        font-size: 0.7rem;
+        line-height: 1.2;
+    }
+    
+    /* Compact text areas and inputs */
+    textarea {
+        font-size: 0.75rem;
+    }
+    
+    /* iframe components */
+    iframe {
+        margin: 0 !important;
+    }
+</style>
+"""
+
+def main():
+    """Main application."""
 
     # Main content area
     if not st.session_state.presentation_loaded:
         show_upload_page()
         # Footer
         st.markdown("---")
-
-        st.markdown(
-            """
-            <div style="
-                display: flex;
-                flex-direction: column;
-                align-items: center;
-                gap: 0.4rem;
-            ">
-                <div style="font-size: 1.2rem;">
-                    <a href="https://presentlm.github.io/PresentLM/"
-                       target="_blank"
-                       style="margin-right: 0.75rem; color: inherit;"
-                       title="Documentation">
-                        <i class="fa-solid fa-book"></i>
-                    </a>
-                    <a href="https://github.com/PresentLM/PresentLM"
-                       target="_blank"
-                       style="color: inherit;"
-                       title="GitHub">
-                        <i class="fa-brands fa-github"></i>
-                    </a>
-                </div>
-                <div style="font-size: 0.75rem; color: #6b7280;">
-                    © 2026 PresentLM. All rights reserved.
-                </div>
-            </div>
-            """,
-            unsafe_allow_html=True
-        )
+        st.markdown(_FOOTER_HTML, unsafe_allow_html=True)
     else:
         show_presentation_page()
 
@@ -226,39 +518,38 @@ def show_upload_page():
     with tab2:
         st.header("Load Saved Presentation")
         
-        # Get list of saved presentations
-        saved_presentations = get_saved_presentations(Config.DATA_DIR)
+        # Get list of saved presentations (cached until the data dir changes)
+        saved_presentations = get_saved_presentation_index(Config.DATA_DIR.stat().st_mtime_ns)
         
         if not saved_presentations:
             st.info("No saved presentations found. Process a presentation first to save it.")
         else:
             st.write(f"Found {len(saved_presentations)} saved presentation(s)")
-            
-            # Display presentations in a table-like format
-            for idx, pres in enumerate(saved_presentations):
-                with st.container():
-                    col1, col2, col3 = st.columns([3, 2, 1])
-                    
-                    with col1:
-                        st.write(f"**{pres.get('filename', 'Unknown')}**")
-                        st.caption(f"Slides: {pres.get('num_slides', 0)} | Model: {pres.get('llm_model', 'N/A')}")
-                    
-                    with col2:
-                        timestamp_str = pres.get('timestamp', '')
-                        if timestamp_str:
-                            # Format timestamp for display
-                            from datetime import datetime
-                            try:
-                                dt = datetime.strptime(timestamp_str, "%Y%m%d_%H%M%S")
-                                st.caption(dt.strftime("%Y-%m-%d %H:%M"))
-                            except:
-                                st.caption(timestamp_str)
-                    
-                    with col3:
-                        if st.button("Load", key=f"load_{idx}", width="stretch"):
-                            load_saved_presentation(pres.get('timestamp'))
-                    
-                    st.divider()
+
+            # One selectable table instead of N containers/buttons - the
+            # widget tree stays O(1) no matter how many decks are saved
+            import pandas as pd
+
+            df = pd.DataFrame([
+                {
+                    "Filename": pres.get('filename', 'Unknown'),
+                    "Slides": pres.get('num_slides', 0),
+                    "Model": pres.get('llm_model', 'N/A'),
+                    "Saved": pres.get('timestamp_display', ''),
+                }
+                for pres in saved_presentations
+            ])
+            event = st.dataframe(
+                df,
+                hide_index=True,
+                width="stretch",
+                on_select="rerun",
+                selection_mode="single-row",
+                key="saved_presentations_table"
+            )
+            if event.selection.rows:
+                selected = saved_presentations[event.selection.rows[0]]
+                load_saved_presentation(selected.get('timestamp'))
 
 
 def process_presentation(
@@ -306,11 +597,14 @@ TEST_MODE=true
         filename = sanitize_filename(uploaded_file.name)
         file_path = Config.SLIDES_DIR / f"{timestamp}_{filename}"
 
+        # Stream to disk in 1 MB chunks; getbuffer() would materialize a
+        # second in-memory copy of the whole upload first
         with open(file_path, "wb") as f:
-            f.write(uploaded_file.getbuffer())
+            shutil.copyfileobj(uploaded_file, f, 1024 * 1024)
 
         # Parse slides
         print("Parsing slides...")
+        from src.core import NarrationGenerator, SlideParser
         parser = SlideParser(use_vision=True)
         slides = parser.parse(file_path)
 
@@ -330,25 +624,66 @@ TEST_MODE=true
         # Save to session state first (before audio generation)
         st.session_state.slides = slides
         st.session_state.narrations = narrations
+        # Parallel arrays for the render hot path: plain list indexing
+        # instead of dataclass attribute traversal on every rerun
+        st.session_state.slide_images = [s.image_data for s in slides]
+        st.session_state.narration_texts = [n.narration_text for n in narrations]
         st.session_state.audio_segments = [None] * len(narrations)  # Placeholder list
         st.session_state.audio_ready = [False] * len(narrations)
+        st.session_state.audio_ready_count = 0
+        st.session_state.audio_ready_version += 1
+        st.session_state.pop('cached_slide_options', None)
         st.session_state.llm_model = llm_model
         st.session_state.test_mode = test_mode
         st.session_state.timestamp = timestamp
         st.session_state.audio_generation_complete = test_mode  # Complete immediately in test mode
 
+        # Kick off the PDF export now so it is ready by the time anyone
+        # reaches for the download button
+        st.session_state.pdf_future = get_pdf_executor().submit(
+            generate_narration_pdf, slides, narrations
+        )
+
         # Generate audio in background (skip in test mode to save tokens)
         if test_mode:
             print("Test mode enabled - Skipping TTS generation to save tokens")
             # Mark all slides as ready in test mode
             st.session_state.audio_ready = [True] * len(narrations)
+            st.session_state.audio_ready_count = len(narrations)
+            st.session_state.audio_ready_version += 1
             st.session_state.presentation_loaded = True
         else:
             print("Starting audio generation in background...")
             st.session_state.generating_audio = True
 
-            # Initialize progress file on disk
-            save_audio_progress(timestamp, [False] * len(narrations), False)
+            # Initialize in-memory progress state shared with the UI
+            audio_state = get_audio_state(timestamp)
+            audio_state["ready"] = [False] * len(narrations)
+            audio_state["segments"] = [None] * len(narrations)
+            audio_state["complete"] = False
+
+            # Signalled by the background thread once slide 1 audio exists
+            first_ready = threading.Event()
+
+            # Debounced crash-recovery snapshots: the TTS loop enqueues the
+            # latest (ready, complete) state and this writer persists it,
+            # draining the queue first so stale intermediates are dropped
+            # and synthesis never waits on file I/O
+            writer_q = queue.Queue()
+
+            def progress_writer():
+                while True:
+                    ready, complete = writer_q.get()
+                    while True:
+                        try:
+                            ready, complete = writer_q.get_nowait()
+                        except queue.Empty:
+                            break
+                    save_audio_progress(timestamp, ready, complete)
+                    if complete:
+                        return
+
+            threading.Thread(target=progress_writer, daemon=True).start()
 
             # Start background thread for audio generation
             def generate_audio_background():
@@ -358,56 +693,92 @@ TEST_MODE=true
                 segments_list = [None] * len(narrations)
 
                 try:
-                    tts = TTSEngine(voice=tts_voice)  # Uses Config.TTS_PROVIDER
-
-                    for idx, narration in enumerate(narrations):
+                    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+                    tts = get_tts_engine(tts_voice)  # Uses Config.TTS_PROVIDER
+
+                    # API providers spend each call in an HTTPS round-trip,
+                    # so a 40-slide deck serialized is ~40 RTTs; a small
+                    # bounded pool overlaps them (each OpenAI request still
+                    # paces itself through the shared account-level
+                    # RateLimiter before hitting the API). The local qwen
+                    # model gets one worker - its calls would only be
+                    # serialized by the TTS lock/GPU anyway, and one worker
+                    # keeps them in slide order.
+                    is_local_tts = Config.TTS_PROVIDER == "qwen"
+                    max_workers = 1 if is_local_tts else max(1, Config.TTS_CONCURRENT_REQUESTS)
+
+                    def synthesize(idx):
+                        narration = narrations[idx]
                         print(f"DEBUG: Starting audio generation for slide {idx + 1}/{len(narrations)}")
-                        try:
-                            audio_path = Config.AUDIO_DIR / f"{timestamp}_slide_{narration.slide_number}.mp3"
+                        audio_path = Config.AUDIO_DIR / f"{timestamp}_slide_{narration.slide_number}.mp3"
+                        if is_local_tts:
+                            with get_tts_lock():
+                                segment = tts.generate_audio(narration.narration_text, audio_path)
+                        else:
                             segment = tts.generate_audio(narration.narration_text, audio_path)
-                            segment.slide_number = narration.slide_number
+                        segment.slide_number = narration.slide_number
+                        return segment
+
+                    # Submission order starts slide 1 first, so its wait is
+                    # still dominated by a single synthesis call
+                    with ThreadPoolExecutor(max_workers=max_workers) as tts_pool:
+                        futures = {
+                            tts_pool.submit(synthesize, idx): idx
+                            for idx in range(len(narrations))
+                        }
+                        for future in as_completed(futures):
+                            idx = futures[future]
+                            try:
+                                segment = future.result()
+                            except Exception as e:
+                                print(f"Error generating audio for slide {idx + 1}: {e}")
+                                if idx == 0:
+                                    first_ready.set()
+                                continue
 
                             # Store segment locally
                             segments_list[idx] = segment
                             ready_flags[idx] = True
 
-                            # Save progress to disk
-                            save_audio_progress(timestamp, ready_flags, False)
-                            print(f"DEBUG: Marked slide {idx + 1} as ready in file")
+                            # Publish progress to the shared in-memory state
+                            with audio_state["lock"]:
+                                audio_state["segments"][idx] = segment
+                                audio_state["ready"][idx] = True
+                            writer_q.put_nowait((list(ready_flags), False))
+                            print(f"DEBUG: Marked slide {idx + 1} as ready")
 
-                        except Exception as e:
-                            print(f"Error generating audio for slide {idx + 1}: {e}")
-                            ready_flags[idx] = False
-                            save_audio_progress(timestamp, ready_flags, False)
+                            if idx == 0:
+                                first_ready.set()
 
-                    # Mark as complete
-                    save_audio_progress(timestamp, ready_flags, True)
-                    print(f"DEBUG: All audio generation complete, marked as done in file")
+                    # Mark as complete (final snapshot also ends the writer)
+                    with audio_state["lock"]:
+                        audio_state["complete"] = True
+                    writer_q.put_nowait((list(ready_flags), True))
+                    print(f"DEBUG: All audio generation complete")
 
                     # Also save audio segments data now that all are complete
                     audio_data = [seg.to_dict() for seg in segments_list if seg]
-                    save_json({"audio_segments": audio_data}, Config.DATA_DIR / f"{timestamp}_audio.json")
+                    save_msgpack({"audio_segments": audio_data}, Config.DATA_DIR / f"{timestamp}_audio.msgpack")
                     print(f"DEBUG: Saved {len(audio_data)} audio segments to file")
 
                 except Exception as e:
                     print(f"Fatal error in audio generation: {e}")
-                    save_audio_progress(timestamp, ready_flags, True)
+                    with audio_state["lock"]:
+                        audio_state["complete"] = True
+                    writer_q.put_nowait((list(ready_flags), True))
+                    # Unblock the waiting main thread even on failure
+                    first_ready.set()
 
             audio_thread = threading.Thread(target=generate_audio_background, daemon=True)
             audio_thread.start()
 
-            # Poll until first slide is ready (no timeout - wait indefinitely)
-            first_slide_ready = False
-            while not first_slide_ready:
-                progress_data = load_audio_progress(timestamp)
-                if progress_data and progress_data['ready'][0]:
-                    # First slide ready
-                    st.session_state.presentation_loaded = True
-                    print("First slide ready! Starting presentation...")
-                    first_slide_ready = True
-                    break
-                time.sleep(0.5)
-            time.sleep(1)
+            # Block until the first slide is ready (no timeout - wait
+            # indefinitely); the event wakes us immediately instead of
+            # burning a progress check per 500 ms
+            first_ready.wait()
+            st.session_state.presentation_loaded = True
+            print("First slide ready! Starting presentation...")
         # Save metadata
         metadata = {
             "timestamp": timestamp,
@@ -435,6 +806,10 @@ TEST_MODE=true
         # Print benchmark summary to console
         benchmark.print_summary()
 
+        # One explicit sweep for cycles left behind by parsing/generation
+        # (auto GC is disabled at module level)
+        gc.collect(generation=1)
+
         # Rerun to transition to presentation mode
         st.rerun()
 
@@ -449,13 +824,23 @@ def load_saved_presentation(timestamp: str):
             # Update session state
             st.session_state.slides = data['slides']
             st.session_state.narrations = data['narrations']
+            st.session_state.slide_images = [s.image_data for s in data['slides']]
+            st.session_state.narration_texts = [n.narration_text for n in data['narrations']]
             st.session_state.audio_segments = data['audio_segments']
             st.session_state.presentation_loaded = True
             st.session_state.current_slide_idx = 0
             st.session_state.timestamp = timestamp
 
+            # Warm the PDF export in the background
+            st.session_state.pdf_future = get_pdf_executor().submit(
+                generate_narration_pdf, data['slides'], data['narrations']
+            )
+
             # Mark all audio as ready (since it's a saved presentation)
             st.session_state.audio_ready = [True] * len(data['slides'])
+            st.session_state.audio_ready_count = len(data['slides'])
+            st.session_state.audio_ready_version += 1
+            st.session_state.pop('cached_slide_options', None)
             st.session_state.audio_generation_complete = True
             st.session_state.generating_audio = False
             
@@ -476,229 +861,353 @@ def load_saved_presentation(timestamp: str):
                     st.warning(f"Could not load existing benchmarks: {e}")
             
             st.success(f"Loaded presentation: {metadata.get('filename', 'Unknown')}")
+
+            # Sweep deserialization garbage (auto GC is disabled at module level)
+            gc.collect(generation=1)
             st.rerun()
             
         except Exception as e:
             st.error(f"Failed to load presentation: {e}")
 
 
-@st.cache_data
-def get_slide_image(image_data: bytes) -> bytes:
-    """Cache slide images to avoid reprocessing on every rerender.
-    Also optimizes images for faster display.
+# Display images wider than this get downscaled; slides are shown at most
+# ~60vh anyway, so shipping 4K renders to the browser is pure transfer cost
+_DISPLAY_MAX_WIDTH = 1600
+
+@st.cache_data(show_spinner=False, hash_funcs={bytes: len})
+def get_slide_image(deck_id: str, slide_number: int, image_data: bytes) -> bytes:
+    """Cache display-ready slide images, downscaling oversized renders.
+
+    hash_funcs keys the image bytes by length - cache_data would otherwise
+    hash multiple MB per slide per rerun. Slide images are immutable, so
+    (deck_id, slide_number, len) identifies them. Images wider than
+    _DISPLAY_MAX_WIDTH are re-encoded as JPEG q85 for display; smaller
+    ones pass through untouched.
 
     Args:
-        slide_number: Unique identifier for the slide
+        deck_id: Session timestamp identifying the deck
+        slide_number: 1-based slide number
         image_data: The raw image bytes
 
     Returns:
         Optimized image bytes ready for display
     """
-    # For JPEG images from PDF, return as-is (already optimized)
-    # For other formats, could add additional optimization here
-    return image_data
+    from PIL import Image as PILImage
 
+    try:
+        img = PILImage.open(BytesIO(image_data))
+        if img.width <= _DISPLAY_MAX_WIDTH:
+            return image_data
+
+        ratio = _DISPLAY_MAX_WIDTH / img.width
+        img = img.convert("RGB").resize(
+            (_DISPLAY_MAX_WIDTH, int(img.height * ratio)),
+            PILImage.LANCZOS
+        )
+        buffer = BytesIO()
+        img.save(buffer, format="JPEG", quality=85, optimize=True)
+        return buffer.getvalue()
+    except Exception:
+        # Unreadable image - let st.image handle the original bytes
+        return image_data
+
+
+def get_question_handler(model: str):
+    """One QuestionHandler per deck, reused across questions.
+
+    The handler carries the conversation history and the vision-image
+    dedup window, so rebuilding it per question would re-upload the slide
+    image and answer every follow-up without context. Kept in session
+    state rather than cache_resource - history is per-viewer - and keyed
+    on (deck timestamp, model) so loading another deck or switching
+    models starts fresh.
+    """
+    from src.core import QuestionHandler
 
-def show_presentation_page():
-    """Show presentation viewer with new clean UI design."""
+    key = (st.session_state.get('timestamp'), model)
+    cached = st.session_state.get('_question_handler')
+    if cached is None or cached[0] != key:
+        cached = (key, QuestionHandler(model=model))
+        st.session_state._question_handler = cached
+    return cached[1]
 
-    # Add custom CSS for compact toolbar and viewport-fitted layout
-    st.markdown("""
-    <style>
-        /* Hide default Streamlit elements */
-        #MainMenu {visibility: hidden;}
-        header {visibility: hidden;}
-        footer {visibility: hidden;}
-        
-        /* Make body fit viewport exactly */
-        html, body {
-            height: 100vh;
-            overflow: hidden !important;
-        }
-        
-        [data-testid="stAppViewContainer"] {
-            height: 100vh;
-            overflow-y: auto;
-            overflow-x: hidden;
-        }
-        
-        /* Main container - constrain to viewport */
-        .block-container {
-            padding: 0.2rem 0.4rem;
-            max-width: 100%;
-            min-height: 100vh;
-            max-height: 100vh;
-        }
-        
-        /* Reduce all vertical spacing */
-        .element-container {
-            margin-bottom: 0.08rem;
-        }
-        
-        div[data-testid="stVerticalBlock"] > div {
-            gap: 0.08rem;
-        }
-        
-        /* Compact buttons */
-        .stButton button {
-            padding: 0.15rem 0.35rem;
-            font-size: 0.75rem;
-            height: 1.8rem;
-            line-height: 1;
-        }
-        
-        /* Hide home button completely and remove its space */
-        .st-key-home_button {
-            display: none !important;
-            height: 0 !important;
-            margin: 0 !important;
-            padding: 0 !important;
-            visibility: hidden !important;
-        }
-        
-        /* Compact selectbox */
-        div[data-baseweb="select"] {
-            margin-bottom: 0.05rem;
-            min-height: 28px;
-        }
-        
-        div[data-baseweb="select"] > div {
-            min-height: 28px;
-            font-size: 0.75rem;
-        }
-        
-        /* Compact expander */
-        .streamlit-expanderHeader {
-            font-size: 0.7rem;
-            padding: 0.15rem 0.35rem;
-            font-weight: 500;
-            min-height: 26px;
-        }
-        
-        .streamlit-expanderContent {
-            padding: 0.25rem 0.4rem;
-            max-height: 8vh;
-            overflow-y: auto;
-            font-size: 0.7rem;
-            line-height: 1.3;
-        }
-        
-        /* Slide image - use viewport-relative sizing */
-        .stImage {
-            max-height: 60vh;
-            min-height: 200px;
-            object-fit: contain;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            margin: 0.1rem 0;
-        }
-        
-        .stImage img {
-            max-height: 50vh;
-            height: auto;
-            width: auto;
-            max-width: 100%;
-            object-fit: contain;
-        }
-        
-        /* Compact audio player */
-        audio {
-            height: 28px;
-        }
-        
-        /* Compact horizontal dividers */
-        hr {
-            margin: 0.1rem 0;
-            border-width: 0.5px;
-        }
-        
-        /* Compact download button */
-        .stDownloadButton button {
-            padding: 0.15rem 0.35rem;
-            font-size: 0.75rem;
-            height: 1.8rem;
-            line-height: 1;
-        }
-        
-        /* Reduce gap between columns */
-        div[data-testid="column"] {
-            padding: 0 0.1rem;
-        }
-        
-        /* Compact progress bar */
-        .stProgress {
-            height: 0.15rem;
-        }
-        
-        /* Compact info/warning boxes */
-        .stAlert {
-            padding: 0.15rem 0.35rem;
-            font-size: 0.7rem;
-            line-height: 1.2;
-        }
-        
-        /* Compact text areas and inputs */
-        textarea {
-            font-size: 0.75rem;
-        }
-        
-        /* iframe components */
-        iframe {
-            margin: 0 !important;
-        }
-    </style>
-    """, unsafe_allow_html=True)
 
-    # Update from progress file ONCE per render, but throttle to avoid excessive file I/O
-    timestamp = st.session_state.get('timestamp')
+@st.fragment
+def render_qa_panel(slides, narrations, current_idx):
+    """Q&A side panel, scoped as a fragment.
+
+    Typing a question, toggling the input mode or recording audio only
+    rerun this panel instead of re-rendering the whole presentation page.
+    State changes the rest of the page depends on (pause/feedback flags,
+    closing the panel) escalate to a full rerun explicitly.
+    """
+    st.markdown("### Ask a Question")
+
+    # If waiting for feedback on previous answer
+    if st.session_state.waiting_for_feedback:
+        st.markdown(f"**Q:** {st.session_state.current_question}")
+        st.markdown(f"**A:** {st.session_state.current_answer}")
+
+        # Play answer audio if available and not in test mode
+        if st.session_state.answer_audio_path and not st.session_state.get('test_mode', True):
+            answer_audio_ready = Path(st.session_state.answer_audio_path).exists()
+            if not answer_audio_ready:
+                # TTS is still running in the background; the answer text is
+                # already readable while we wait for the file to land
+                st.caption("🔊 Generating answer audio...")
+                if st_autorefresh is not None:
+                    st_autorefresh(interval=1000, key="answer_audio_poll")
+                elif st.button("🔄", key="answer_audio_refresh", help="Check for audio"):
+                    st.rerun()
+            elif not st.session_state.answer_audio_finished:
+                answer_audio_path = Path(st.session_state.answer_audio_path)
+                answer_audio_base64 = get_audio_base64(
+                    str(answer_audio_path), answer_audio_path.stat().st_mtime
+                )
+
+                answer_audio_html = f"""
+                <div style="margin: 10px 0;">
+                    <audio id="answer-audio" controls autoplay style="width: 100%;">
+                        <source src="data:audio/mpeg;base64,{answer_audio_base64}" type="audio/mpeg">
+                    </audio>
+                </div>
+                <script>
+                    (function() {{
+                        function clickDoneButton() {{
+                            const btn = window.parent.document.querySelector('.st-key-answer_audio_done button');
+                            if (btn) {{
+                                btn.click();
+                                return true;
+                            }}
+                            return false;
+                        }}
+
+                        // One-shot fallback check; the 'ended' handler
+                        // normally clicks the button itself
+                        if (localStorage.getItem('answer_audio_finished') === 'true') {{
+                            localStorage.removeItem('answer_audio_finished');
+                            clickDoneButton();
+                        }}
+
+                        const audio = document.getElementById('answer-audio');
+                        audio.addEventListener('ended', function() {{
+                            // Click the done button directly; flag
+                            // only as a fallback for the next rerun
+                            if (!clickDoneButton()) {{
+                                localStorage.setItem('answer_audio_finished', 'true');
+                            }}
+                        }});
+                    }})();
+                </script>
+                """
+                components.html(answer_audio_html, height=70)
+
+                answer_done_btn = st.button(
+                    "answer_done_hidden",
+                    key="answer_audio_done",
+                    type="secondary"
+                )
+
+                if answer_done_btn:
+                    st.session_state.answer_audio_finished = True
+                    st.rerun()
+        else:
+            st.session_state.answer_audio_finished = True
+
+        if st.session_state.answer_audio_finished:
+            st.divider()
+            st.markdown("**Was this helpful?**")
+
+            if st.button("✅ Yes", key="yes_helpful", width="stretch"):
+                st.session_state.update(
+                    is_paused=False,
+                    waiting_for_feedback=False,
+                    asking_question=False,
+                    current_question=None,
+                    current_answer=None,
+                    answer_audio_path=None,
+                    answer_audio_finished=False,
+                    qa_panel_open=False,
+                )
+                st.rerun(scope="app")
+
+            if st.button("❌ No", key="no_helpful", width="stretch"):
+                st.session_state.update(
+                    waiting_for_feedback=False,
+                    current_answer=None,
+                    answer_audio_path=None,
+                    answer_audio_finished=False,
+                )
+                st.rerun(scope="app")
+
+    elif st.session_state.asking_question:
+        question_mode = st.radio(
+            "Input method:",
+            ["Text", "Audio"],
+            horizontal=True,
+            key="qa_input_mode"
+        )
+
+        question_text = None
+
+        if question_mode == "Text":
+            question_text = st.text_area("Your question:", key="text_question", height=100)
+            ask_button = st.button("Submit", type="primary", width="stretch")
+        else:
+            st.info("🎤 Record:")
+            audio_bytes = st.audio_input("Record question")
+
+            if audio_bytes:
+                with st.spinner("Transcribing..."):
+                    try:
+                        from src.core import STTEngine
+                        stt = STTEngine(provider="openai")
+                        question_text = stt.transcribe(audio_bytes.read())
+                        st.success(f"📝 {question_text}")
+                        ask_button = True
+                    except Exception as e:
+                        st.error(f"Error: {e}")
+                        ask_button = False
+            else:
+                ask_button = False
+
+        if st.button("Cancel", width="stretch"):
+            st.session_state.update(
+                asking_question=False,
+                is_paused=False,
+                qa_panel_open=False,
+            )
+            st.rerun(scope="app")
+
+        if ask_button and question_text and question_text.strip():
+            st.session_state.current_question = question_text
+
+            with st.spinner("Generating answer..."):
+                try:
+                    question_handler = get_question_handler(
+                        st.session_state.get('llm_model', 'gpt-4o-mini')
+                    )
+
+                    answer = question_handler.answer_question(
+                        question=question_text,
+                        current_slide=slides[current_idx],
+                        current_narration=narrations[current_idx],
+                        all_slides=slides,
+                        additional_context=None,
+                        use_vision=True  # Enable vision to include slide image in context
+                    )
+
+                    st.session_state.current_answer = answer
 
-    # Initialize last check time if not exists
-    if 'last_progress_check' not in st.session_state:
-        st.session_state.last_progress_check = 0
+                    if not st.session_state.get('test_mode', True):
+                        import tempfile
+                        answer_audio_path = Path(tempfile.gettempdir()) / f"presentlm_answer_{get_timestamp()}.mp3"
+                        tts_voice = st.session_state.get('tts_voice', Config.TTS_VOICE)
 
-    current_time = time.time()
-    should_check_progress = (current_time - st.session_state.last_progress_check) >= 2.0  # Check every 2 seconds
+                        def generate_answer_audio():
+                            """Synthesize the answer off the main thread.
 
-    if timestamp and not st.session_state.get('audio_generation_complete', True) and should_check_progress:
-        st.session_state.last_progress_check = current_time
+                            Written to a temp name and renamed into place so
+                            the UI (which polls for the final path) never sees
+                            a half-written file.
+                            """
+                            tmp_path = answer_audio_path.with_name(f"{answer_audio_path.stem}_tmp.mp3")
+                            try:
+                                tts = get_tts_engine(tts_voice)  # Uses Config.TTS_PROVIDER
+                                with get_tts_lock():
+                                    tts.generate_audio(answer, tmp_path)
+                                os.replace(tmp_path, answer_audio_path)
+                            except Exception as e:
+                                print(f"⚠️ Could not generate answer audio: {e}")
+                                tmp_path.unlink(missing_ok=True)
 
-        # Load progress from file
-        progress_data = load_audio_progress(timestamp)
+                        # Show the answer text immediately; the player appears
+                        # once the background synthesis lands the file
+                        threading.Thread(target=generate_answer_audio, daemon=True).start()
+                        st.session_state.answer_audio_path = answer_audio_path
+                    else:
+                        st.session_state.answer_audio_path = None
 
-        if progress_data:
-            ready_in_file = sum(progress_data['ready'])
-            ready_in_session = sum(st.session_state.audio_ready)
+                    benchmark = get_benchmark_tracker()
+                    if 'timestamp' in st.session_state:
+                        benchmark_file = Config.DATA_DIR / f"benchmark_{st.session_state.timestamp}.json"
+                        benchmark.save_json(benchmark_file)
 
-            # Update session state based on file
-            has_updates = False
-            for idx in range(len(progress_data['ready'])):
-                if progress_data['ready'][idx] and not st.session_state.audio_ready[idx]:
-                    # Load the audio segment from disk
+                    st.session_state.update(
+                        waiting_for_feedback=True,
+                        asking_question=False,
+                        answer_audio_finished=False,
+                    )
+                    st.rerun(scope="app")
+
+                except Exception as e:
+                    st.error(f"Failed: {e}")
+                    st.session_state.asking_question = False
+                    st.session_state.is_paused = False
+
+
+def show_presentation_page():
+    """Show presentation viewer with new clean UI design."""
+
+    # Custom CSS for compact toolbar and viewport-fitted layout
+    st.markdown(_PRESENTATION_CSS, unsafe_allow_html=True)
+
+    # While audio is still generating, schedule a rerun every 2 s; once
+    # complete the autorefresh simply isn't declared again and timed
+    # reruns stop entirely
+    if st_autorefresh is not None and st.session_state.get('generating_audio', False):
+        st_autorefresh(interval=2000, key="audio_poll")
+
+    # Pull progress from the shared in-memory state - cheap enough (no file
+    # I/O, no JSON parse) to check on every rerun without throttling
+    timestamp = st.session_state.get('timestamp')
+
+    if timestamp and not st.session_state.get('audio_generation_complete', True):
+        audio_state = get_audio_state(timestamp)
+        with audio_state["lock"]:
+            ready_snapshot = list(audio_state["ready"])
+            segments_snapshot = list(audio_state["segments"])
+            generation_complete = audio_state["complete"]
+
+        # Crash recovery: a restarted process has empty in-memory state, so
+        # fall back to the completion snapshot on disk
+        if not ready_snapshot:
+            progress_data = load_audio_progress(timestamp)
+            if progress_data:
+                ready_snapshot = progress_data['ready']
+                segments_snapshot = [None] * len(ready_snapshot)
+                generation_complete = progress_data['complete']
+
+        for idx, ready in enumerate(ready_snapshot):
+            if ready and not st.session_state.audio_ready[idx]:
+                segment = segments_snapshot[idx]
+                if segment is None:
+                    # Rebuild the segment from the audio file on disk
                     audio_path = Config.AUDIO_DIR / f"{timestamp}_slide_{idx + 1}.mp3"
-                    if audio_path.exists():
-                        from src.core import AudioSegment
-                        segment = AudioSegment(
-                            audio_path=audio_path,
-                            duration=0,
-                            text="",
-                            slide_number=idx + 1
-                        )
-                        st.session_state.audio_segments[idx] = segment
-                        st.session_state.audio_ready[idx] = True
-                        has_updates = True
-
-            # Check if complete
-            if progress_data['complete'] and not st.session_state.audio_generation_complete:
-                st.session_state.audio_generation_complete = True
-                st.session_state.generating_audio = False
-
-                # Clean up progress file
-                progress_file = get_audio_progress_file(timestamp)
-                if progress_file.exists():
-                    progress_file.unlink()
-
-                has_updates = True
+                    if not audio_path.exists():
+                        continue
+                    segment = load_audio_segment(audio_path, idx + 1)
+                st.session_state.audio_segments[idx] = segment
+                st.session_state.audio_ready[idx] = True
+                st.session_state.audio_ready_count += 1
+                st.session_state.audio_ready_version += 1
+
+                # Patch the cached selector label in place - only this
+                # entry's emoji changed, no need to rebuild all N labels
+                cached_options = st.session_state.get('cached_slide_options')
+                if cached_options and idx < len(cached_options):
+                    cached_options[idx] = cached_options[idx].replace("⏳", "🔊", 1)
+                    st.session_state.cached_audio_version = st.session_state.audio_ready_version
+
+        # Check if complete
+        if generation_complete and not st.session_state.audio_generation_complete:
+            st.session_state.audio_generation_complete = True
+            st.session_state.generating_audio = False
+
+            # Clean up progress snapshot
+            progress_file = get_audio_progress_file(timestamp)
+            if progress_file.exists():
+                progress_file.unlink()
 
     slides = st.session_state.slides
     narrations = st.session_state.narrations
@@ -738,59 +1247,82 @@ def show_presentation_page():
     # NOW read the current index (after all navigation is processed)
     current_idx = st.session_state.current_slide_idx
 
-    # Clear audio position only when slide changes
-    slide_changed = st.session_state.previous_slide_idx != current_idx
-    if slide_changed:
+    # Track slide changes. Clearing the localStorage flags happens inside
+    # the audio player's own script below - spinning up a throwaway iframe
+    # per navigation just to run two removeItem calls cost a full iframe
+    # load/teardown each time
+    if st.session_state.previous_slide_idx != current_idx:
         st.session_state.previous_slide_idx = current_idx
-        clear_flag_html = f"""
-        <script>
-            console.log('Slide changed to {current_idx}, clearing localStorage flags');
-            localStorage.removeItem('presentlm_audio_finished');
-            localStorage.removeItem('presentlm_audio_position_slide_{current_idx}');
-        </script>
-        """
-        components.html(clear_flag_html, height=0)
 
     # Initialize Q&A panel state
     if 'qa_panel_open' not in st.session_state:
         st.session_state.qa_panel_open = False
 
     current_slide = slides[current_idx]
-    current_narration = narrations[current_idx]
+
+    # SoA views populated at load; rebuild if a stale session predates them
+    if len(st.session_state.get('slide_images', ())) != len(slides):
+        st.session_state.slide_images = [s.image_data for s in slides]
+        st.session_state.narration_texts = [n.narration_text for n in narrations]
+    slide_images = st.session_state.slide_images
+    narration_texts = st.session_state.narration_texts
 
     # === 2. SLIDE SELECTOR BAR ===
-    # Create slide options for selectbox (cache to avoid regenerating on every rerender)
-    audio_ready_hash = tuple(st.session_state.audio_ready)  # Use tuple for hashability
-
-    if 'cached_slide_options' not in st.session_state or st.session_state.get('cached_audio_hash') != audio_ready_hash:
-        slide_options = []
-        for idx, slide in enumerate(slides):
-            audio_indicator = "🔊" if st.session_state.audio_ready[idx] else "⏳"
-            slide_options.append(f"{audio_indicator} Slide {idx + 1}/{len(slides)}: {slide.title}")
-        st.session_state.cached_slide_options = slide_options
-        st.session_state.cached_audio_hash = audio_ready_hash
+    # Long decks get a number input: it ships a single int to the frontend
+    # instead of re-diffing the full O(N) option list on every rerun
+    use_number_input = len(slides) > 50
+
+    if use_number_input:
+        slide_options = None
+
+        if st.session_state.get('slide_changed_externally', False):
+            st.session_state.slide_number_value = current_idx + 1
+            st.session_state.slide_changed_externally = False
+
+        if 'slide_number_value' not in st.session_state:
+            st.session_state.slide_number_value = current_idx + 1
+
+        def on_slide_select():
+            """Handle slide selection from the number input."""
+            selected_idx = int(st.session_state.slide_number_value) - 1
+            if selected_idx != st.session_state.current_slide_idx:
+                if st.session_state.audio_ready[selected_idx]:
+                    st.session_state.current_slide_idx = selected_idx
+                    st.session_state.audio_finished = False
     else:
-        slide_options = st.session_state.cached_slide_options
-
-    # Synchronize selectbox with current_idx
-    # If slide changed externally (via buttons), update the selectbox value
-    if st.session_state.get('slide_changed_externally', False):
-        st.session_state.slide_selector_value = slide_options[current_idx]
-        st.session_state.slide_changed_externally = False
-
-    # Initialize selectbox value if not set
-    if 'slide_selector_value' not in st.session_state:
-        st.session_state.slide_selector_value = slide_options[current_idx]
-
-    # Use on_change callback to handle slide selection
-    def on_slide_select():
-        """Handle slide selection from selectbox."""
-        selected_text = st.session_state.slide_selector_value
-        selected_idx = slide_options.index(selected_text)
-        if selected_idx != st.session_state.current_slide_idx:
-            if st.session_state.audio_ready[selected_idx]:
-                st.session_state.current_slide_idx = selected_idx
-                st.session_state.audio_finished = False
+        # Create slide options for selectbox (cache to avoid regenerating on
+        # every rerender; a single version int tracks audio_ready changes)
+        audio_version = st.session_state.audio_ready_version
+
+        if 'cached_slide_options' not in st.session_state or st.session_state.get('cached_audio_version') != audio_version:
+            slide_options = []
+            for idx, slide in enumerate(slides):
+                audio_indicator = "🔊" if st.session_state.audio_ready[idx] else "⏳"
+                slide_options.append(f"{audio_indicator} Slide {idx + 1}/{len(slides)}: {slide.title}")
+            st.session_state.cached_slide_options = slide_options
+            st.session_state.cached_audio_version = audio_version
+        else:
+            slide_options = st.session_state.cached_slide_options
+
+        # Synchronize selectbox with current_idx
+        # If slide changed externally (via buttons), update the selectbox value
+        if st.session_state.get('slide_changed_externally', False):
+            st.session_state.slide_selector_value = slide_options[current_idx]
+            st.session_state.slide_changed_externally = False
+
+        # Initialize selectbox value if not set
+        if 'slide_selector_value' not in st.session_state:
+            st.session_state.slide_selector_value = slide_options[current_idx]
+
+        # Use on_change callback to handle slide selection
+        def on_slide_select():
+            """Handle slide selection from selectbox."""
+            selected_text = st.session_state.slide_selector_value
+            selected_idx = slide_options.index(selected_text)
+            if selected_idx != st.session_state.current_slide_idx:
+                if st.session_state.audio_ready[selected_idx]:
+                    st.session_state.current_slide_idx = selected_idx
+                    st.session_state.audio_finished = False
 
     # === CREATE CENTERED LAYOUT FOR PRESENTATION ===
     # Use columns to center the toolbar, slide selector, slide, and controls
@@ -805,78 +1337,94 @@ def show_presentation_page():
         with toolbar_col1:
             # Hidden button for home navigation
             if st.button("home_hidden", key="home_button"):
-                st.session_state.presentation_loaded = False
-                st.session_state.is_paused = False
-                st.session_state.current_question = None
-                st.session_state.current_answer = None
-                st.session_state.waiting_for_feedback = False
-                st.session_state.qa_panel_open = False
+                # Single pass through session-state internals instead of six
+                st.session_state.update(
+                    presentation_loaded=False,
+                    is_paused=False,
+                    current_question=None,
+                    current_answer=None,
+                    waiting_for_feedback=False,
+                    qa_panel_open=False,
+                )
                 st.rerun()
 
             # Logo icon that triggers the hidden button
-            components.html(f"""
-            <div style="width:110px; height:40px; display: flex; align-items: center; margin: 0; padding: 0;">
-                <img id="presentlm-home-icon"
-                     src="data:image/png;base64,{get_base64_image('src/assets/PresentLM-logo.png')}"
-                     style="width:100%; height:100%; object-fit: contain; cursor: pointer;"
-                     alt="Home"
-                     title="Back to Home"
-                >
-            </div>
-            <script>
-                (function() {{
-                    const icon = document.getElementById('presentlm-home-icon');
-                    if (icon) {{
-                        icon.addEventListener('click', function() {{
-                            // Find and click the hidden home button
-                            const buttons = window.parent.document.querySelectorAll('button');
-                            for (let btn of buttons) {{
-                                const text = btn.textContent || '';
-                                if (text.includes('home_hidden')) {{
-                                    btn.click();
-                                    return;
-                                }}
-                            }}
-                        }});
-                    }}
-                }})();
-            </script>
-            """, height=40)
+            components.html(get_home_icon_html(), height=40)
 
         with toolbar_col3:
-            # Export button - generates PDF with slides and narrations
+            # Export button - PDF generation runs on the background executor
+            # at load time; fall back to the cached synchronous path if no
+            # future was submitted this session
+            pdf_future = st.session_state.get('pdf_future')
+            if pdf_future is not None and pdf_future.done() and pdf_future.exception() is not None:
+                # The background build failed; drop the future and fall
+                # through to the synchronous path instead of leaving the
+                # button disabled forever with the failure swallowed
+                print(f"⚠️ Background PDF export failed, rebuilding inline: {pdf_future.exception()}")
+                st.session_state.pdf_future = None
+                pdf_future = None
+
+            if pdf_future is None:
+                pdf_data = get_narration_pdf_bytes(
+                    presentation_signature(slides, narrations), slides, narrations
+                )
+            elif pdf_future.done():
+                pdf_data = pdf_future.result()
+            else:
+                pdf_data = b''
+                # The audio-generation poll normally drives reruns; once
+                # generation is done nothing would notice the future
+                # completing, so keep a poll alive while it is pending
+                if st_autorefresh is not None and not st.session_state.get('generating_audio', False):
+                    st_autorefresh(interval=1000, key="pdf_export_poll")
+
             st.download_button(
                 label="📥",
-                data=lambda : generate_narration_pdf(slides, narrations),
+                data=pdf_data,
                 file_name=f"narrations_{st.session_state.get('timestamp', 'export')}.pdf",
                 mime="application/pdf",
-                help="Download Narrations as PDF",
+                help="Download Narrations as PDF" if pdf_data else "⏳ Preparing PDF export...",
+                disabled=not pdf_data,
                 width="stretch"
             )
 
 
         # Show audio generation progress if still generating
         if not st.session_state.get('audio_generation_complete', True):
-            ready_count = sum(st.session_state.audio_ready)
+            ready_count = st.session_state.audio_ready_count
             total_count = len(st.session_state.audio_ready)
             progress_pct = ready_count / total_count if total_count > 0 else 0
 
-            col_prog, col_refresh = st.columns([9, 1])
-            with col_prog:
+            if st_autorefresh is not None:
+                # Autorefresh polls for progress, no manual refresh needed
                 st.progress(progress_pct, text=f"Audio generation: {ready_count}/{total_count} slides ready")
-            with col_refresh:
-                if st.button("🔄", key="refresh_progress", help="Refresh"):
-                    st.rerun()
+            else:
+                col_prog, col_refresh = st.columns([9, 1])
+                with col_prog:
+                    st.progress(progress_pct, text=f"Audio generation: {ready_count}/{total_count} slides ready")
+                with col_refresh:
+                    if st.button("🔄", key="refresh_progress", help="Refresh"):
+                        st.rerun()
 
 
         # Slide selector
-        st.selectbox(
-            label="Navigate to slide:",
-            options=slide_options,
-            key="slide_selector_value",
-            on_change=on_slide_select,
-            label_visibility="collapsed"
-        )
+        if use_number_input:
+            st.number_input(
+                label="Navigate to slide:",
+                min_value=1,
+                max_value=len(slides),
+                key="slide_number_value",
+                on_change=on_slide_select,
+                label_visibility="collapsed"
+            )
+        else:
+            st.selectbox(
+                label="Navigate to slide:",
+                options=slide_options,
+                key="slide_selector_value",
+                on_change=on_slide_select,
+                label_visibility="collapsed"
+            )
 
         # === 3. SLIDE DISPLAY WITH Q&A PANEL ===
         # When Q&A is open, create columns within this area only
@@ -901,18 +1449,19 @@ def show_presentation_page():
                     st.rerun()
 
             # Slide content
-            if current_slide.image_data:
-                # Show original high-res image
+            deck_id = st.session_state.get('timestamp', '')
+            if slide_images[current_idx]:
+                # Raw bytes straight from the cache; no BytesIO wrapper needed
                 st.image(
-                    BytesIO(current_slide.image_data),
+                    get_slide_image(deck_id, current_idx + 1, slide_images[current_idx]),
                     width="stretch"
                 )
 
                 # Preload adjacent slides into cache for instant navigation
-                if current_idx > 0 and slides[current_idx - 1].image_data:
-                    pass  # No need to cache, always show original
-                if current_idx < len(slides) - 1 and slides[current_idx + 1].image_data:
-                    pass
+                if current_idx > 0 and slide_images[current_idx - 1]:
+                    get_slide_image(deck_id, current_idx, slide_images[current_idx - 1])
+                if current_idx < len(slides) - 1 and slide_images[current_idx + 1]:
+                    get_slide_image(deck_id, current_idx + 2, slide_images[current_idx + 1])
             else:
                 st.markdown(current_slide.content)
 
@@ -924,193 +1473,7 @@ def show_presentation_page():
         # === Q&A PANEL (if open) ===
         if st.session_state.qa_panel_open and qa_col:
             with qa_col:
-                st.markdown("### Ask a Question")
-
-                # If waiting for feedback on previous answer
-                if st.session_state.waiting_for_feedback:
-                    st.markdown(f"**Q:** {st.session_state.current_question}")
-                    st.markdown(f"**A:** {st.session_state.current_answer}")
-
-                    # Play answer audio if available and not in test mode
-                    if st.session_state.answer_audio_path and not st.session_state.get('test_mode', True):
-                        if not st.session_state.answer_audio_finished:
-                            with open(st.session_state.answer_audio_path, 'rb') as audio_file:
-                                answer_audio_bytes = audio_file.read()
-                                answer_audio_base64 = base64.b64encode(answer_audio_bytes).decode()
-
-                            answer_audio_html = f"""
-                            <div style="margin: 10px 0;">
-                                <audio id="answer-audio" controls autoplay style="width: 100%;">
-                                    <source src="data:audio/mpeg;base64,{answer_audio_base64}" type="audio/mpeg">
-                                </audio>
-                            </div>
-                            <script>
-                                (function() {{
-                                    const audio = document.getElementById('answer-audio');
-                                    audio.addEventListener('ended', function() {{
-                                        localStorage.setItem('answer_audio_finished', 'true');
-                                    }});
-                                }})();
-                            </script>
-                            """
-                            components.html(answer_audio_html, height=70)
-
-                            answer_done_btn = st.button(
-                                "answer_done_hidden",
-                                key="answer_audio_done",
-                                type="secondary"
-                            )
-
-                            components.html("""
-                            <script>
-                                (function() {
-                                    function hideHiddenButtons() {
-                                        const buttons = window.parent.document.querySelectorAll('button');
-                                        buttons.forEach(btn => {
-                                            const text = btn.textContent || '';
-                                            if (text.includes('_hidden')) {
-                                                btn.style.display = 'none';
-                                                btn.style.visibility = 'hidden';
-                                                btn.style.position = 'absolute';
-                                                btn.style.left = '-9999px';
-                                            }
-                                        });
-                                    }
-                                    hideHiddenButtons();
-                                    setInterval(hideHiddenButtons, 100);
-                                    
-                                    function checkAnswerFinished() {
-                                        const finished = localStorage.getItem('answer_audio_finished');
-                                        if (finished === 'true') {
-                                            localStorage.removeItem('answer_audio_finished');
-                                            const buttons = window.parent.document.querySelectorAll('button');
-                                            for (let btn of buttons) {
-                                                if (btn.textContent.includes('answer_done_hidden')) {
-                                                    btn.click();
-                                                    return;
-                                                }
-                                            }
-                                        }
-                                    }
-                                    setInterval(checkAnswerFinished, 500);
-                                })();
-                            </script>
-                            """, height=0)
-
-                            if answer_done_btn:
-                                st.session_state.answer_audio_finished = True
-                                st.rerun()
-                    else:
-                        st.session_state.answer_audio_finished = True
-
-                    if st.session_state.answer_audio_finished:
-                        st.divider()
-                        st.markdown("**Was this helpful?**")
-
-                        if st.button("✅ Yes", key="yes_helpful", width="stretch"):
-                            st.session_state.is_paused = False
-                            st.session_state.waiting_for_feedback = False
-                            st.session_state.asking_question = False
-                            st.session_state.current_question = None
-                            st.session_state.current_answer = None
-                            st.session_state.answer_audio_path = None
-                            st.session_state.answer_audio_finished = False
-                            st.session_state.qa_panel_open = False
-                            st.rerun()
-
-                        if st.button("❌ No", key="no_helpful", width="stretch"):
-                            st.session_state.waiting_for_feedback = False
-                            st.session_state.current_answer = None
-                            st.session_state.answer_audio_path = None
-                            st.session_state.answer_audio_finished = False
-                            st.rerun()
-
-                elif st.session_state.asking_question:
-                    question_mode = st.radio(
-                        "Input method:",
-                        ["Text", "Audio"],
-                        horizontal=True,
-                        key="qa_input_mode"
-                    )
-
-                    question_text = None
-
-                    if question_mode == "Text":
-                        question_text = st.text_area("Your question:", key="text_question", height=100)
-                        ask_button = st.button("Submit", type="primary", width="stretch")
-                    else:
-                        st.info("🎤 Record:")
-                        audio_bytes = st.audio_input("Record question")
-
-                        if audio_bytes:
-                            with st.spinner("Transcribing..."):
-                                try:
-                                    stt = STTEngine(provider="openai")
-                                    question_text = stt.transcribe(audio_bytes.read())
-                                    st.success(f"📝 {question_text}")
-                                    ask_button = True
-                                except Exception as e:
-                                    st.error(f"Error: {e}")
-                                    ask_button = False
-                        else:
-                            ask_button = False
-
-                    if st.button("Cancel", width="stretch"):
-                        st.session_state.asking_question = False
-                        st.session_state.is_paused = False
-                        st.session_state.qa_panel_open = False
-                        st.rerun()
-
-                    if ask_button and question_text and question_text.strip():
-                        st.session_state.current_question = question_text
-
-                        with st.spinner("Generating answer..."):
-                            try:
-                                question_handler = QuestionHandler(
-                                    model=st.session_state.get('llm_model', 'gpt-4o-mini')
-                                )
-
-                                answer = question_handler.answer_question(
-                                    question=question_text,
-                                    current_slide=slides[current_idx],
-                                    current_narration=narrations[current_idx],
-                                    all_slides=slides,
-                                    additional_context=None,
-                                    use_vision=True  # Enable vision to include slide image in context
-                                )
-
-                                st.session_state.current_answer = answer
-
-                                if not st.session_state.get('test_mode', True):
-                                    try:
-                                        tts = TTSEngine(
-                                            voice=st.session_state.get('tts_voice', Config.TTS_VOICE)
-                                        )  # Uses Config.TTS_PROVIDER
-
-                                        import tempfile
-                                        answer_audio_path = Path(tempfile.gettempdir()) / f"presentlm_answer_{get_timestamp()}.mp3"
-                                        tts.generate_audio(answer, answer_audio_path)
-                                        st.session_state.answer_audio_path = answer_audio_path
-                                    except Exception as e:
-                                        st.warning(f"Could not generate audio: {e}")
-                                        st.session_state.answer_audio_path = None
-                                else:
-                                    st.session_state.answer_audio_path = None
-
-                                benchmark = get_benchmark_tracker()
-                                if 'timestamp' in st.session_state:
-                                    benchmark_file = Config.DATA_DIR / f"benchmark_{st.session_state.timestamp}.json"
-                                    benchmark.save_json(benchmark_file)
-
-                                st.session_state.waiting_for_feedback = True
-                                st.session_state.asking_question = False
-                                st.session_state.answer_audio_finished = False
-                                st.rerun()
-
-                            except Exception as e:
-                                st.error(f"Failed: {e}")
-                                st.session_state.asking_question = False
-                                st.session_state.is_paused = False
+                render_qa_panel(slides, narrations, current_idx)
 
         # === 4. CONTROLS BAR: Previous | Audio Player | Next ===
         # Controls bar (continue in presentation_col)
@@ -1138,20 +1501,79 @@ def show_presentation_page():
                     should_autoplay = not (st.session_state.is_paused or st.session_state.waiting_for_feedback or st.session_state.asking_question)
                     autoplay_attr = "autoplay" if should_autoplay else ""
 
-                    with open(audio_segment.audio_path, 'rb') as audio_file:
-                        audio_bytes = audio_file.read()
-                        audio_base64 = base64.b64encode(audio_bytes).decode()
+                    # Reuse the previously built player HTML when nothing
+                    # about it changed: Streamlit only remounts the iframe
+                    # when the element content differs, so sending the
+                    # byte-identical string keeps the media element (and its
+                    # buffered audio) alive across same-slide reruns. The
+                    # deck timestamp is part of the key - slide index alone
+                    # would replay the previous deck's audio after loading
+                    # another presentation
+                    player_key = (st.session_state.get('timestamp'), current_idx, autoplay_attr)
+                    cached_player = st.session_state.get('_audio_player_cache')
+
+                    if cached_player is not None and cached_player[0] == player_key:
+                        audio_html = cached_player[1]
+                    else:
+                        audio_src = get_static_audio_url(audio_segment.audio_path)
+                        if not audio_src:
+                            audio_src = "data:audio/mpeg;base64," + get_audio_base64(
+                                str(audio_segment.audio_path),
+                                audio_segment.audio_path.stat().st_mtime
+                            )
 
-                    audio_html = f"""
+                        # Prefetch the next slide's audio while this one plays
+                        # so auto-advance starts instantly (static route only;
+                        # base64 fallback has nothing to prefetch)
+                        prefetch_tag = ""
+                        if current_idx < len(slides) - 1 and st.session_state.audio_ready[current_idx + 1]:
+                            next_segment = st.session_state.audio_segments[current_idx + 1]
+                            if next_segment and next_segment.audio_path.exists():
+                                next_src = get_static_audio_url(next_segment.audio_path)
+                                if next_src:
+                                    prefetch_tag = f'<link rel="prefetch" href="{next_src}" as="audio">'
+
+                        audio_html = f"""
+                    {prefetch_tag}
                     <audio id="presentlm-audio-{current_idx}" controls {autoplay_attr} style="width: 100%;">
-                        <source src="data:audio/mpeg;base64,{audio_base64}" type="audio/mpeg">
+                        <source src="{audio_src}" type="audio/mpeg">
                     </audio>
                     <script>
                         (function() {{
                             const audio = document.getElementById('presentlm-audio-{current_idx}');
                             const slideKey = 'presentlm_audio_position_slide_{current_idx}';
                             const finishedKey = 'presentlm_audio_finished';
-                            
+                            const lastSlideKey = 'presentlm_current_slide';
+
+                            // On slide change, drop the stale finished flag and
+                            // any saved position for this slide; same-slide
+                            // reruns keep the position so playback resumes
+                            if (localStorage.getItem(lastSlideKey) !== '{current_idx}') {{
+                                localStorage.removeItem(finishedKey);
+                                localStorage.removeItem(slideKey);
+                                localStorage.setItem(lastSlideKey, '{current_idx}');
+                            }}
+
+                            function clickAdvanceButton() {{
+                                const btn = window.parent.document.querySelector('.st-key-auto_advance_{current_idx} button');
+                                if (btn) {{
+                                    btn.click();
+                                    return true;
+                                }}
+                                return false;
+                            }}
+
+                            // One-shot fallback: pick up a finished flag left
+                            // from a rerun where the advance button was missing
+                            // (single delayed retry in case the button mounts
+                            // after this iframe boots; no polling loop)
+                            if (localStorage.getItem(finishedKey) === 'true') {{
+                                localStorage.removeItem(finishedKey);
+                                if (!clickAdvanceButton()) {{
+                                    setTimeout(clickAdvanceButton, 300);
+                                }}
+                            }}
+
                             audio.addEventListener('loadedmetadata', function() {{
                                 const savedPosition = localStorage.getItem(slideKey);
                                 if (savedPosition && !isNaN(parseFloat(savedPosition))) {{
@@ -1160,24 +1582,36 @@ def show_presentation_page():
                                 }}
                             }});
                             
-                            setInterval(function() {{
-                                if (!audio.paused && !audio.ended) {{
+                            // Throttled position save driven by the media
+                            // element itself instead of a timer
+                            let lastSave = 0;
+                            audio.addEventListener('timeupdate', function() {{
+                                const now = Date.now();
+                                if (!audio.paused && !audio.ended && now - lastSave >= 2000) {{
+                                    lastSave = now;
                                     localStorage.setItem(slideKey, audio.currentTime.toString());
                                 }}
-                            }}, 1000);
-                            
+                            }});
+
                             audio.addEventListener('pause', function() {{
                                 localStorage.setItem(slideKey, audio.currentTime.toString());
                             }});
-                            
+
                             audio.addEventListener('ended', function() {{
                                 console.log('Audio ended!');
                                 localStorage.removeItem(slideKey);
-                                localStorage.setItem(finishedKey, 'true');
+                                // Click the auto-advance button directly from
+                                // the event; fall back to a flag picked up on
+                                // the next rerun if it is not rendered
+                                if (!clickAdvanceButton()) {{
+                                    localStorage.setItem(finishedKey, 'true');
+                                }}
                             }});
                         }})();
                     </script>
                     """
+                        st.session_state._audio_player_cache = (player_key, audio_html)
+
                     components.html(audio_html, height=60)
             elif st.session_state.get('test_mode', True):
                 st.info("🔇 Test mode: Audio generation skipped")
@@ -1200,9 +1634,11 @@ def show_presentation_page():
         # === 5. NARRATION EXPANDER ===
         # Place at presentation_col level to span full width
         with st.expander("📄 Narration", expanded=False):
-            st.markdown(current_narration.narration_text)
+            st.markdown(narration_texts[current_idx])
 
-    # Auto-advance polling (outside the presentation_col, as it's hidden)
+    # Auto-advance trigger (outside the presentation_col, as it's hidden);
+    # the player iframe owns all the audio-finished JS, including the
+    # one-shot fallback for flags left from earlier reruns
     if hasattr(st.session_state, 'audio_segments') and st.session_state.audio_segments:
         if not st.session_state.waiting_for_feedback and not st.session_state.is_paused and not st.session_state.asking_question:
             if current_idx < len(slides) - 1:
@@ -1214,97 +1650,93 @@ def show_presentation_page():
                     on_click=lambda: st.session_state.update({'advance_slide': True})
                 )
 
-                components.html("""
-                <script>
-                    (function() {
-                        function hideHiddenButtons() {
-                            const buttons = window.parent.document.querySelectorAll('button');
-                            buttons.forEach(btn => {
-                                const text = btn.textContent || '';
-                                if (text.includes('_hidden')) {
-                                    btn.style.display = 'none';
-                                    btn.style.visibility = 'hidden';
-                                    btn.style.position = 'absolute';
-                                    btn.style.left = '-9999px';
-                                }
-                            });
-                        }
-                        hideHiddenButtons();
-                        setInterval(hideHiddenButtons, 100);
-                    })();
-                </script>
-                """, height=0)
-
-                components.html(
-                    f"""
-                    <script>
-                        (function() {{
-                            function checkAudioFinished() {{
-                                const audioFinished = localStorage.getItem('presentlm_audio_finished');
-                                if (audioFinished === 'true') {{
-                                    console.log('Audio finished flag detected, clicking auto-advance button...');
-                                    localStorage.removeItem('presentlm_audio_finished');
-                                    const buttons = window.parent.document.querySelectorAll('button');
-                                    for (let btn of buttons) {{
-                                        const text = btn.textContent || '';
-                                        if (text.includes('auto_advance_hidden')) {{
-                                            console.log('Found auto-advance button, clicking now');
-                                            btn.click();
-                                            return;
-                                        }}
-                                    }}
-                                }}
-                            }}
-                            setInterval(checkAudioFinished, 500);
-                        }})();
-                    </script>
-                    """,
-                    height=0
-                )
-
     # Footer
     st.markdown("---")
-    
-    st.markdown(
-        """
-        <div style="
-            display: flex;
-            flex-direction: column;
-            align-items: center;
-            gap: 0.4rem;
-        ">
-            <div style="font-size: 1.2rem;">
-                <a href="https://presentlm.github.io/PresentLM/"
-                   target="_blank"
-                   style="margin-right: 0.75rem; color: inherit;"
-                   title="Documentation">
-                    <i class="fa-solid fa-book"></i>
-                </a>
-                <a href="https://github.com/PresentLM/PresentLM"
-                   target="_blank"
-                   style="color: inherit;"
-                   title="GitHub">
-                    <i class="fa-brands fa-github"></i>
-                </a>
-            </div>
-            <div style="font-size: 0.75rem; color: #6b7280;">
-                © 2026 PresentLM. All rights reserved.
-            </div>
-        </div>
-        """,
-        unsafe_allow_html=True
-    )
+    st.markdown(_FOOTER_HTML, unsafe_allow_html=True)
+
 
+# Streamlit serves <app dir>/static at app/static/ when enableStaticServing
+# is on (.streamlit/config.toml)
+_STATIC_DIR = Path(__file__).parent / "static"
 
+
+def get_static_audio_url(audio_path: Path) -> str:
+    """Expose an audio file via Streamlit's static route, returning its URL.
+
+    Hardlinks the file into the static dir under an mtime-keyed name so the
+    browser can stream it (with range requests and its own caching) instead
+    of receiving a multi-MB base64 data URI on every rerun. Returns '' when
+    the file cannot be linked, so callers can fall back to base64.
+    """
+    try:
+        _STATIC_DIR.mkdir(exist_ok=True)
+        name = f"{audio_path.stem}_{audio_path.stat().st_mtime_ns}{audio_path.suffix}"
+        dest = _STATIC_DIR / name
+        if not dest.exists():
+            # Drop stale links from earlier generations of the same file
+            for old in _STATIC_DIR.glob(f"{audio_path.stem}_*{audio_path.suffix}"):
+                old.unlink(missing_ok=True)
+            try:
+                os.link(audio_path, dest)
+            except OSError:
+                shutil.copyfile(audio_path, dest)
+        return f"app/static/{name}"
+    except Exception:
+        return ""
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def get_audio_base64(audio_path: str, mtime: float) -> str:
+    """Base64-encode an audio file, cached on (path, mtime).
+
+    The player re-renders on every rerun (pause, Q&A, navigation), but the
+    underlying file only changes when TTS rewrites it — the mtime key keeps
+    the cache correct while skipping the repeated read + encode.
+    """
+    with open(audio_path, 'rb') as f:
+        return base64.b64encode(f.read()).decode('ascii')
+
+
+@st.cache_data(show_spinner=False)
 def get_base64_image(image_path: str) -> str:
-    """Convert image to base64 string."""
+    """Convert image to base64 string (cached: encoded once per process)."""
     try:
         with open(image_path, 'rb') as f:
-            return base64.b64encode(f.read()).decode()
+            return base64.b64encode(f.read()).decode('ascii')
     except:
         return ""
 
 
+@st.cache_data(show_spinner=False)
+def get_home_icon_html() -> str:
+    """Build the toolbar home-icon HTML once instead of on every rerun."""
+    return f"""
+    <div style="width:110px; height:40px; display: flex; align-items: center; margin: 0; padding: 0;">
+        <img id="presentlm-home-icon"
+             src="data:image/png;base64,{get_base64_image('src/assets/PresentLM-logo.png')}"
+             style="width:100%; height:100%; object-fit: contain; cursor: pointer;"
+             alt="Home"
+             title="Back to Home"
+        >
+    </div>
+    <script>
+        (function() {{
+            const icon = document.getElementById('presentlm-home-icon');
+            if (icon) {{
+                icon.addEventListener('click', function() {{
+                    // Direct lookup via the widget's stable key class -
+                    // no scan over every button in the document
+                    const btn = window.parent.document.querySelector('.st-key-home_button button');
+                    if (btn) {{
+                        btn.click();
+                    }}
+                }});
+            }}
+        }})();
+    </script>
+    """
+
+
 def generate_narration_export(narrations) -> str:
     """Generate a text export of all narrations."""
     export_lines = []
@@ -1331,19 +1763,418 @@ def generate_narration_export(narrations) -> str:
     return "\n".join(export_lines)
 
 
+def presentation_signature(slides, narrations) -> str:
+    """Cheap content signature for the loaded deck (keys the PDF cache)."""
+    h = hashlib.blake2b(digest_size=16)
+    for slide in slides:
+        h.update((slide.image_data or b"")[:64])
+    for narration in narrations:
+        h.update(narration.narration_text.encode())
+    return h.hexdigest()
+
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def get_narration_pdf_bytes(sig: str, _slides, _narrations) -> bytes:
+    """PDF export bytes, cached per deck signature.
+
+    download_button ships its data on every rerun, and the old
+    `data=lambda: ...` was a bug anyway — Streamlit never calls the lambda,
+    so the download delivered a pickled function instead of a PDF. The
+    underscore args are excluded from hashing; `sig` keys the cache so the
+    ReportLab pipeline runs once per deck.
+    """
+    return generate_narration_pdf(_slides, _narrations)
+
+
+def _prepare_pdf_image(image_data: bytes):
+    """Decode, scale and re-encode one slide image for the PDF export.
+
+    Returns (img_bytes, display_width, display_height) with dimensions in
+    PDF points. Top-level (not nested in the builder) so the export can fan
+    unique images out across worker threads; PIL's resize and JPEG encode
+    release the GIL.
+    """
+    from PIL import Image as PILImage
+    from reportlab.lib.units import inch
+
+    # Cheap integrity pass over the headers first: verify() raises on
+    # malformed input before any pixel buffer is allocated, instead of
+    # failing deep inside a decode with megabytes already committed.
+    # verify() leaves the object unusable, so reopen afterwards.
+    img = PILImage.open(BytesIO(image_data))
+    img.verify()
+    img = PILImage.open(BytesIO(image_data))
+
+    # Cap pathological inputs outright (a 50 MP slide render is not real)
+    if img.width * img.height > 50_000_000:
+        raise ValueError(f"slide image too large to embed: {img.width}x{img.height}")
+
+    # Calculate scaled dimensions to fit width (max 6 inches wide)
+    max_width = 6.5 * inch
+    max_height = 4.5 * inch
+
+    img_width, img_height = img.size
+    aspect_ratio = img_height / img_width
+
+    # Scale to fit within max dimensions
+    if img_width > max_width:
+        new_width = max_width
+        new_height = new_width * aspect_ratio
+    else:
+        new_width = img_width
+        new_height = img_height
+
+    # Check if height exceeds max
+    if new_height > max_height:
+        new_height = max_height
+        new_width = new_height / aspect_ratio
+
+    # ReportLab embeds whatever pixels it is handed, so a 4K screenshot
+    # displayed at 6.5in would ship megapixels per page; downsample to
+    # ~150 DPI at the display size first
+    target_px_w = int(new_width / inch * 150)
+
+    # Fast path: already JPEG at (or under) the embed resolution.
+    # ReportLab copies DCT streams into the PDF verbatim, so the source
+    # bytes can be fed straight through with no decode/encode pass at all.
+    if img.format == 'JPEG' and img_width <= target_px_w:
+        return image_data, new_width, new_height
+
+    # JPEG embeds as a raw DCT stream - far smaller and faster for
+    # ReportLab to write than Flate-compressed PNG on rasterized slide
+    # content. Keep PNG only when the image actually uses transparency.
+    has_alpha = 'A' in img.getbands() and img.getextrema()[-1][0] < 255
+
+    def encode(image):
+        img_buffer = BytesIO()
+        if has_alpha:
+            # PNG keeps the alpha channel; fast compression - the PDF is
+            # downloaded once, so aggressive compression is wasted CPU
+            image.save(img_buffer, format='PNG', optimize=False, compress_level=1)
+        else:
+            image.convert('RGB').save(
+                img_buffer, format='JPEG',
+                quality=82, optimize=True, progressive=True
+            )
+        return img_buffer.getvalue()
+
+    if img_width > target_px_w:
+        img.thumbnail((target_px_w, int(target_px_w * aspect_ratio) + 1), PILImage.LANCZOS)
+        img_bytes = encode(img)
+    elif img.format == 'PNG' and has_alpha:
+        # Already PNG, within the target size and genuinely transparent -
+        # embed the original bytes without a re-encode
+        img_bytes = image_data
+    else:
+        img_bytes = encode(img)
+
+    return img_bytes, new_width, new_height
+
+
 def generate_narration_pdf(slides, narrations) -> bytes:
     """
     Generate a PDF export of presentation with slide images and narrations.
-    
+
     Args:
         slides: List of Slide objects containing image data
         narrations: List of SlideNarration objects
-        
+
     Returns:
         PDF file as bytes
     """
-    buffer = BytesIO()
-    doc = SimpleDocTemplate(buffer, pagesize=letter, 
+    if Config.PDF_ENGINE == "weasyprint":
+        try:
+            return _generate_narration_pdf_weasyprint(slides, narrations)
+        except ImportError:
+            print("⚠️ PDF_ENGINE=weasyprint but weasyprint is not installed, falling back to reportlab")
+    if Config.PDF_ENGINE == "canvas":
+        return _generate_narration_pdf_canvas(slides, narrations)
+    if len(narrations) > 50:
+        return _generate_narration_pdf_chunked(slides, narrations)
+    return _generate_narration_pdf_reportlab(slides, narrations)
+
+
+def _generate_narration_pdf_chunked(slides, narrations, chunk_size=50) -> bytes:
+    """Build a large export as 50-slide sub-documents merged with pypdf.
+
+    SimpleDocTemplate.build holds the whole story plus rendered pages in
+    memory and walks it in multiple passes, so a 200-slide deck peaks at
+    the full document size. Building fixed-size chunks independently
+    bounds peak memory to one chunk, lets chunks overlap on the thread
+    pool (image prep and compression release the GIL even though the
+    platypus layout itself is serial), and pypdf concatenates the page
+    trees without re-rendering anything. Threads rather than processes:
+    spawned workers would re-import this Streamlit script outside a run
+    context.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    from pypdf import PdfWriter
+
+    chunks = [
+        (slides[start:start + chunk_size], narrations[start:start + chunk_size], start == 0)
+        for start in range(0, len(narrations), chunk_size)
+    ]
+
+    def build_chunk(chunk):
+        chunk_slides, chunk_narrations, is_first = chunk
+        # Only the first chunk carries the title page, with statistics
+        # computed over the full deck rather than its own 50 slides
+        return _generate_narration_pdf_reportlab(
+            chunk_slides, chunk_narrations,
+            include_title=is_first, stats_source=narrations,
+        )
+
+    with ThreadPoolExecutor(max_workers=min(len(chunks), os.cpu_count() or 2)) as pool:
+        chunk_pdfs = list(pool.map(build_chunk, chunks))
+
+    writer = PdfWriter()
+    for chunk_pdf in chunk_pdfs:
+        writer.append(BytesIO(chunk_pdf))
+    merged = BytesIO()
+    writer.write(merged)
+    return merged.getvalue()
+
+
+def _generate_narration_pdf_canvas(slides, narrations) -> bytes:
+    """Direct-draw PDF export, used when PDF_ENGINE=canvas.
+
+    The export layout is fixed - heading, one image, narration block,
+    duration line, page break - so it can be drawn straight onto a pdfgen
+    canvas instead of going through the platypus wrap/measure pipeline.
+    Line breaking is the only layout work left and simpleSplit covers it.
+    Images are handed to drawImage as ImageReaders keyed by content hash:
+    the canvas embeds each reader's stream once and repeated pages just
+    reference it, and JPEG sources pass through as raw DCT streams with
+    no decode at all.
+    """
+    import tempfile
+
+    from reportlab.lib.colors import HexColor
+    from reportlab.lib.pagesizes import letter
+    from reportlab.lib.units import inch
+    from reportlab.lib.utils import ImageReader, simpleSplit
+    from reportlab.pdfgen import canvas as pdf_canvas
+
+    page_width, page_height = letter
+    margin = 0.75 * inch
+    text_width = page_width - 2 * margin
+    max_img_width = 6.5 * inch
+    max_img_height = 4.5 * inch
+
+    buffer = tempfile.SpooledTemporaryFile(max_size=8 << 20)
+    c = pdf_canvas.Canvas(buffer, pagesize=letter)
+
+    total_slides = len(narrations)
+    total_duration = sum(n.estimated_duration for n in narrations)
+    total_minutes = int(total_duration // 60)
+    total_seconds = int(total_duration % 60)
+
+    # Title page
+    c.setFont("Helvetica-Bold", 24)
+    c.setFillColor(HexColor('#2c3e50'))
+    c.drawCentredString(page_width / 2, page_height - margin - 24, "PRESENTATION NARRATIONS")
+    y = page_height - margin - 90
+    c.setFont("Helvetica-Bold", 16)
+    c.setFillColor(HexColor('#34495e'))
+    c.drawString(margin, y, "Presentation Statistics")
+    c.setFont("Helvetica", 12)
+    c.setFillColor(HexColor('#555555'))
+    for line in (
+        f"Total Slides: {total_slides}",
+        f"Estimated Presentation Time: {total_minutes} minutes {total_seconds} seconds",
+        f"Average Time per Slide: {total_duration/total_slides:.1f} seconds",
+    ):
+        y -= 20
+        c.drawString(margin, y, line)
+    c.showPage()
+
+    # One ImageReader per unique image, shared across every page that
+    # shows it (None caches a failed decode so it isn't retried)
+    image_readers = {}
+
+    for i, narration in enumerate(narrations):
+        slide = slides[i] if i < len(slides) else None
+        y = page_height - margin
+
+        c.setFont("Helvetica-Bold", 16)
+        c.setFillColor(HexColor('#34495e'))
+        y -= 16
+        c.drawString(margin, y, f"Slide {narration.slide_number}")
+        y -= 14
+
+        if slide and slide.image_data:
+            image_key = hashlib.blake2b(slide.image_data, digest_size=16).digest()
+            if image_key not in image_readers:
+                try:
+                    image_readers[image_key] = ImageReader(BytesIO(slide.image_data))
+                except Exception:
+                    image_readers[image_key] = None
+            reader = image_readers[image_key]
+
+            if reader is not None:
+                img_width, img_height = reader.getSize()
+                scale = min(max_img_width / img_width, max_img_height / img_height, 1.0)
+                draw_width = img_width * scale
+                draw_height = img_height * scale
+                y -= draw_height
+                c.drawImage(reader, margin, y, width=draw_width, height=draw_height)
+            else:
+                c.setFont("Helvetica-Oblique", 11)
+                c.setFillColor(HexColor('#333333'))
+                y -= 11
+                c.drawString(margin, y, "[Image unavailable]")
+            y -= 0.2 * inch
+
+        c.setFillColor(HexColor('#333333'))
+        c.setFont("Helvetica-Bold", 11)
+        y -= 11
+        c.drawString(margin, y, "Narration:")
+        c.setFont("Helvetica", 11)
+        for para in narration.narration_text.split('\n'):
+            para = para.strip()
+            if not para:
+                continue
+            for line in simpleSplit(para, "Helvetica", 11, text_width):
+                y -= 14
+                if y < margin:
+                    c.showPage()
+                    y = page_height - margin - 14
+                    c.setFont("Helvetica", 11)
+                    c.setFillColor(HexColor('#333333'))
+                c.drawString(margin, y, line)
+            y -= 7
+
+        y -= 14
+        if y < margin:
+            c.showPage()
+            y = page_height - margin - 14
+        c.setFont("Helvetica-Oblique", 10)
+        c.setFillColor(HexColor('#7f8c8d'))
+        c.drawString(
+            margin, y,
+            f"Estimated duration: {narration.estimated_duration:.1f} seconds ({narration.estimated_duration/60:.1f} minutes)"
+        )
+
+        if i < len(narrations) - 1:
+            c.showPage()
+
+    c.save()
+    buffer.seek(0)
+    pdf_bytes = buffer.read()
+    buffer.close()
+    return pdf_bytes
+
+
+def _generate_narration_pdf_weasyprint(slides, narrations) -> bytes:
+    """HTML/CSS-based PDF export, used when PDF_ENGINE=weasyprint.
+
+    The document is laid out as plain HTML with CSS paged-media rules and
+    rendered in one pass by WeasyPrint, which handles text flow and page
+    breaks natively. Slide images go through the same _prepare_pdf_image
+    scaling as the ReportLab path and are embedded as data URIs.
+    WeasyPrint is an optional dependency (heavy native libs), so the
+    import is deferred and the caller falls back to ReportLab when it is
+    missing.
+    """
+    from html import escape
+
+    from weasyprint import HTML
+
+    total_slides = len(narrations)
+    total_duration = sum(n.estimated_duration for n in narrations)
+    total_minutes = int(total_duration // 60)
+    total_seconds = int(total_duration % 60)
+
+    sections = [f"""
+    <div class="title-page">
+      <h1>PRESENTATION NARRATIONS</h1>
+      <h2>Presentation Statistics</h2>
+      <p><b>Total Slides:</b> {total_slides}</p>
+      <p><b>Estimated Presentation Time:</b> {total_minutes} minutes {total_seconds} seconds</p>
+      <p><b>Average Time per Slide:</b> {total_duration/total_slides:.1f} seconds</p>
+    </div>
+    """]
+
+    for i, narration in enumerate(narrations):
+        slide = slides[i] if i < len(slides) else None
+
+        image_html = ""
+        if slide and slide.image_data:
+            try:
+                img_bytes, new_width, new_height = _prepare_pdf_image(slide.image_data)
+                mime = "image/png" if img_bytes[:8] == b"\x89PNG\r\n\x1a\n" else "image/jpeg"
+                img_b64 = base64.b64encode(img_bytes).decode('ascii')
+                image_html = (
+                    f'<img src="data:{mime};base64,{img_b64}" '
+                    f'style="width:{new_width:.1f}pt;height:{new_height:.1f}pt;">'
+                )
+            except Exception:
+                image_html = '<p><i>[Image unavailable]</i></p>'
+
+        narration_body = "<br><br>".join(
+            escape(para.strip())
+            for para in narration.narration_text.split('\n')
+            if para.strip()
+        )
+
+        sections.append(f"""
+    <div class="slide">
+      <h2>Slide {narration.slide_number}</h2>
+      {image_html}
+      <p class="narration"><b>Narration:</b><br>{narration_body}</p>
+      <p class="duration">Estimated duration: {narration.estimated_duration:.1f} seconds ({narration.estimated_duration/60:.1f} minutes)</p>
+    </div>
+    """)
+
+    html = f"""<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<style>
+  @page {{ size: Letter; margin: 0.75in; }}
+  body {{ font-family: Helvetica, Arial, sans-serif; color: #333333; }}
+  .title-page {{ page-break-after: always; }}
+  .slide {{ page-break-after: always; }}
+  .slide:last-child {{ page-break-after: avoid; }}
+  h1 {{ font-size: 24pt; color: #2c3e50; text-align: center; }}
+  h2 {{ font-size: 16pt; color: #34495e; }}
+  .title-page p {{ font-size: 12pt; color: #555555; }}
+  .narration {{ font-size: 11pt; line-height: 14pt; }}
+  .duration {{ font-size: 10pt; color: #7f8c8d; font-style: italic; }}
+</style>
+</head>
+<body>
+{"".join(sections)}
+</body>
+</html>"""
+
+    return HTML(string=html).write_pdf()
+
+
+def _generate_narration_pdf_reportlab(slides, narrations, include_title=True, stats_source=None) -> bytes:
+    """ReportLab/platypus PDF export (the default PDF_ENGINE).
+
+    The chunked builder calls this per sub-document with include_title
+    set only for the first chunk and stats_source pointing at the full
+    narration list so the title-page statistics cover the whole deck.
+    """
+    # Imported here so app startup and ordinary reruns never pay for
+    # reportlab initialization - only the export path does
+    from xml.sax.saxutils import escape
+
+    from reportlab.lib.enums import TA_CENTER, TA_LEFT
+    from reportlab.lib.pagesizes import letter
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib.units import inch
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Image as RLImage, KeepTogether, PageBreak
+
+    # Spooled file: small exports stay in RAM, large ones spill to disk,
+    # and either way we avoid BytesIO.getvalue() materializing a second
+    # full copy of the document at the end of the build
+    import tempfile
+    buffer = tempfile.SpooledTemporaryFile(max_size=8 << 20)
+    doc = SimpleDocTemplate(buffer, pagesize=letter,
                            topMargin=0.75*inch, bottomMargin=0.75*inch,
                            leftMargin=0.75*inch, rightMargin=0.75*inch)
     
@@ -1394,98 +2225,134 @@ def generate_narration_pdf(slides, narrations) -> bytes:
         alignment=TA_LEFT
     )
     
-    # Calculate statistics
-    total_slides = len(narrations)
-    total_duration = sum(n.estimated_duration for n in narrations)
-    total_minutes = int(total_duration // 60)
-    total_seconds = int(total_duration % 60)
-    
-    # Add title page with statistics
-    story.append(Paragraph("PRESENTATION NARRATIONS", title_style))
-    story.append(Spacer(1, 0.3*inch))
-    
-    story.append(Paragraph("<b>Presentation Statistics</b>", heading_style))
-    story.append(Paragraph(f"<b>Total Slides:</b> {total_slides}", stat_style))
-    story.append(Paragraph(f"<b>Estimated Presentation Time:</b> {total_minutes} minutes {total_seconds} seconds", stat_style))
-    story.append(Paragraph(f"<b>Average Time per Slide:</b> {total_duration/total_slides:.1f} seconds", stat_style))
-    
-    story.append(Spacer(1, 0.5*inch))
-    story.append(PageBreak())
+    if include_title:
+        # Calculate statistics
+        stats_narrations = stats_source or narrations
+        total_slides = len(stats_narrations)
+        total_duration = sum(n.estimated_duration for n in stats_narrations)
+        total_minutes = int(total_duration // 60)
+        total_seconds = int(total_duration % 60)
+
+        # Add title page with statistics
+        story.extend([
+            Paragraph("PRESENTATION NARRATIONS", title_style),
+            Spacer(1, 0.3*inch),
+            Paragraph("<b>Presentation Statistics</b>", heading_style),
+            Paragraph(f"<b>Total Slides:</b> {total_slides}", stat_style),
+            Paragraph(f"<b>Estimated Presentation Time:</b> {total_minutes} minutes {total_seconds} seconds", stat_style),
+            Paragraph(f"<b>Average Time per Slide:</b> {total_duration/total_slides:.1f} seconds", stat_style),
+            Spacer(1, 0.5*inch),
+            PageBreak(),
+        ])
     
-    # Add each slide with its narration
+    # Prepare unique images up front, in parallel: decode/resize/encode is
+    # the per-slide CPU hotspot and is independent across slides, while
+    # doc.build() itself is serial. Deduplicated by content hash so a
+    # repeated logo or background is processed once.
+    unique_images = {}
+    for slide in slides:
+        if slide and slide.image_data:
+            image_key = hashlib.blake2b(slide.image_data, digest_size=16).digest()
+            unique_images.setdefault(image_key, slide.image_data)
+
+    def safe_prepare(image_data):
+        try:
+            return _prepare_pdf_image(image_data)
+        except Exception:
+            # Falls through to the "[Image unavailable]" branch below
+            return None
+
+    prepared_images = {}
+    if unique_images:
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=min(len(unique_images), os.cpu_count() or 2)) as image_pool:
+            for image_key, prepared in zip(unique_images, image_pool.map(safe_prepare, unique_images.values())):
+                if prepared is not None:
+                    prepared_images[image_key] = prepared
+
+    # Shared flowables hoisted out of the loop; Spacer and PageBreak are
+    # stateless during layout, so one instance can appear at many story
+    # positions
+    spacer_img = Spacer(1, 0.2*inch)
+    spacer_txt = Spacer(1, 0.1*inch)
+    page_break = PageBreak()
+
+    # Duration lines built (and their markup parsed) in one pass up front
+    # rather than formatting inside the hot loop
+    duration_paragraphs = [
+        Paragraph(
+            f"Estimated duration: {n.estimated_duration:.1f} seconds ({n.estimated_duration/60:.1f} minutes)",
+            duration_style,
+        )
+        for n in narrations
+    ]
+
+    # Add each slide with its narration. Each slide's flowables go into
+    # one KeepTogether so the layout engine sizes the slide as a unit and
+    # fails over to the next page in a single check instead of probing
+    # flowable by flowable.
     for i, narration in enumerate(narrations):
         # Find corresponding slide
         slide = slides[i] if i < len(slides) else None
-        
-        # Add slide number as heading
-        story.append(Paragraph(f"Slide {narration.slide_number}", heading_style))
-        story.append(Spacer(1, 0.1*inch))
-        
+
+        # Slide number heading
+        slide_flowables = [
+            Paragraph(f"Slide {narration.slide_number}", heading_style),
+            spacer_txt,
+        ]
+
         # Add slide image if available
         if slide and slide.image_data:
-            try:
-                # Load image from bytes
-                img = PILImage.open(BytesIO(slide.image_data))
-                
-                # Calculate scaled dimensions to fit width (max 6 inches wide)
-                max_width = 6.5 * inch
-                max_height = 4.5 * inch
-                
-                img_width, img_height = img.size
-                aspect_ratio = img_height / img_width
-                
-                # Scale to fit within max dimensions
-                if img_width > max_width:
-                    new_width = max_width
-                    new_height = new_width * aspect_ratio
-                else:
-                    new_width = img_width
-                    new_height = img_height
-                
-                # Check if height exceeds max
-                if new_height > max_height:
-                    new_height = max_height
-                    new_width = new_height / aspect_ratio
-                
-                # Save to temporary buffer
-                img_buffer = BytesIO()
-                img.save(img_buffer, format='PNG')
-                img_buffer.seek(0)
-                
-                # Add image to PDF
-                rl_img = RLImage(img_buffer, width=new_width, height=new_height)
-                story.append(rl_img)
-                story.append(Spacer(1, 0.2*inch))
-            except Exception as e:
-                # If image fails to load, just continue
-                story.append(Paragraph(f"<i>[Image unavailable]</i>", narration_style))
-                story.append(Spacer(1, 0.2*inch))
-        
-        # Add narration text
-        story.append(Paragraph("<b>Narration:</b>", narration_style))
-        # Break narration into paragraphs if it contains newlines
-        narration_paragraphs = narration.narration_text.split('\n')
-        for para in narration_paragraphs:
-            if para.strip():
-                story.append(Paragraph(para, narration_style))
-        
-        story.append(Spacer(1, 0.1*inch))
-        
-        # Add duration
-        duration_text = f"Estimated duration: {narration.estimated_duration:.1f} seconds ({narration.estimated_duration/60:.1f} minutes)"
-        story.append(Paragraph(duration_text, duration_style))
-        
+            image_key = hashlib.blake2b(slide.image_data, digest_size=16).digest()
+            cached_image = prepared_images.get(image_key)
+
+            if cached_image is not None:
+                img_bytes, new_width, new_height = cached_image
+
+                # Each occurrence gets its own BytesIO wrapper (no data
+                # copy): platypus reads the buffer lazily during
+                # doc.build(), so sharing one between flowables would
+                # tangle their read positions
+                slide_flowables.extend([
+                    RLImage(BytesIO(img_bytes), width=new_width, height=new_height),
+                    spacer_img,
+                ])
+            else:
+                # Image failed to prepare - just continue
+                slide_flowables.extend([
+                    Paragraph(f"<i>[Image unavailable]</i>", narration_style),
+                    spacer_img,
+                ])
+
+        # Add narration text as one flowable: each Paragraph costs a markup
+        # parse plus a wrap/measure pass in the layout engine, so join the
+        # lines with <br/> instead of emitting one Paragraph per line
+        narration_body = "<br/><br/>".join(
+            escape(para.strip())
+            for para in narration.narration_text.split('\n')
+            if para.strip()
+        )
+
+        slide_flowables.extend([
+            Paragraph(f"<b>Narration:</b><br/>{narration_body}", narration_style),
+            spacer_txt,
+            duration_paragraphs[i],
+        ])
+
+        story.append(KeepTogether(slide_flowables))
+
         # Add page break after each slide (except the last one)
         if i < len(narrations) - 1:
-            story.append(PageBreak())
+            story.append(page_break)
     
     # Build PDF
     doc.build(story)
-    
+
     # Get PDF bytes
-    pdf_bytes = buffer.getvalue()
+    buffer.seek(0)
+    pdf_bytes = buffer.read()
     buffer.close()
-    
+
     return pdf_bytes
 
 
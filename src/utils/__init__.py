@@ -6,10 +6,17 @@ from .benchmark import (
     get_benchmark_tracker,
     reset_benchmark_tracker
 )
+from .openai_limiter import (
+    RateLimiter,
+    estimate_tokens,
+    get_rate_limiter
+)
 from .helpers import (
     generate_file_hash,
     save_json,
     load_json,
+    save_msgpack,
+    load_msgpack,
     get_timestamp,
     sanitize_filename,
     save_presentation_data,
@@ -23,9 +30,14 @@ __all__ = [
     "BenchmarkEvent",
     "get_benchmark_tracker",
     "reset_benchmark_tracker",
+    "RateLimiter",
+    "estimate_tokens",
+    "get_rate_limiter",
     "generate_file_hash",
     "save_json",
     "load_json",
+    "save_msgpack",
+    "load_msgpack",
     "get_timestamp",
     "sanitize_filename",
     "save_presentation_data",
@@ -19,6 +19,7 @@ class Config:
     SLIDES_DIR = DATA_DIR / "slides"
     NARRATIONS_DIR = DATA_DIR / "narrations"
     AUDIO_DIR = DATA_DIR / "audio"
+    TTS_CACHE_DIR = DATA_DIR / "tts_cache"
     
     # API Keys
     OPENAI_API_KEY = os.getenv("OPENAI_API_KEY", "")
@@ -33,10 +34,15 @@ class Config:
     LLM_MAX_TOKENS = int(os.getenv("LLM_MAX_TOKENS", "2000"))
     LLM_USE_VISION = os.getenv("LLM_USE_VISION", "true").lower() == "true"  # Use vision models for image analysis
 
+    # OpenAI rate limits (requests/tokens per minute) used by the request throttle
+    OPENAI_MAX_RPM = int(os.getenv("OPENAI_MAX_RPM", "500"))
+    OPENAI_MAX_TPM = int(os.getenv("OPENAI_MAX_TPM", "200000"))
+
     # TTS Configuration
     TTS_PROVIDER = os.getenv("TTS_PROVIDER", "openai")  # openai, elevenlabs, google, edge
     TTS_VOICE = os.getenv("TTS_VOICE", "alloy")
     TTS_SPEED = float(os.getenv("TTS_SPEED", "1.0"))
+    TTS_CONCURRENT_REQUESTS = int(os.getenv("TTS_CONCURRENT_REQUESTS", "3"))  # Parallel synthesis calls for API providers
     
     # STT Configuration
     STT_PROVIDER = os.getenv("STT_PROVIDER", "openai")  # openai, google, azure
@@ -48,11 +54,13 @@ class Config:
     AUDIO_FORMAT = os.getenv("AUDIO_FORMAT", "mp3")
     PRESENTATION_MODE = os.getenv("PRESENTATION_MODE", "auto")  # auto, manual
     TEST_MODE = os.getenv("TEST_MODE", "false").lower() == "true"  # Skip TTS in test mode
+    BENCHMARK_ENABLED = os.getenv("BENCHMARK_ENABLED", "true").lower() == "true"  # Per-call timing/prints
+    PDF_ENGINE = os.getenv("PDF_ENGINE", "reportlab")  # reportlab, canvas, weasyprint (optional dependency)
     
     @classmethod
     def ensure_directories(cls):
         """Ensure all required directories exist."""
-        for directory in [cls.DATA_DIR, cls.SLIDES_DIR, cls.NARRATIONS_DIR, cls.AUDIO_DIR]:
+        for directory in [cls.DATA_DIR, cls.SLIDES_DIR, cls.NARRATIONS_DIR, cls.AUDIO_DIR, cls.TTS_CACHE_DIR]:
             directory.mkdir(parents=True, exist_ok=True)
     
     @classmethod
@@ -30,6 +30,20 @@ def load_json(file_path: Path) -> Dict[str, Any]:
         return json.load(f)
 
 
+def save_msgpack(data: Dict[str, Any], file_path: Path) -> None:
+    """Save data to a msgpack file (binary; much faster than JSON at scale)."""
+    import msgpack
+    with open(file_path, 'wb') as f:
+        f.write(msgpack.packb(data, use_bin_type=True))
+
+
+def load_msgpack(file_path: Path) -> Dict[str, Any]:
+    """Load data from a msgpack file."""
+    import msgpack
+    with open(file_path, 'rb') as f:
+        return msgpack.unpackb(f.read(), raw=False)
+
+
 def save_presentation_data(timestamp: str, slides: List, narrations: List, audio_segments: List, metadata: Dict, base_dir: Path) -> None:
     """Save complete presentation data for later loading."""
     # Save slides
@@ -40,9 +54,9 @@ def save_presentation_data(timestamp: str, slides: List, narrations: List, audio
     narrations_data = [narration.to_dict() for narration in narrations]
     save_json({"narrations": narrations_data}, base_dir / f"{timestamp}_narrations.json")
     
-    # Save audio segments info
+    # Save audio segments info (msgpack: decoded on every presentation load)
     audio_data = [segment.to_dict() for segment in audio_segments] if audio_segments else []
-    save_json({"audio_segments": audio_data}, base_dir / f"{timestamp}_audio.json")
+    save_msgpack({"audio_segments": audio_data}, base_dir / f"{timestamp}_audio.msgpack")
     
     # Save metadata
     save_json(metadata, base_dir / f"{timestamp}_metadata.json")
@@ -62,11 +76,15 @@ def load_presentation_data(timestamp: str, base_dir: Path) -> Dict:
     narrations_data = load_json(base_dir / f"{timestamp}_narrations.json")
     narrations = [SlideNarration.from_dict(n) for n in narrations_data['narrations']]
     
-    # Load audio segments
-    audio_file = base_dir / f"{timestamp}_audio.json"
+    # Load audio segments (msgpack, falling back to legacy JSON saves)
+    audio_file = base_dir / f"{timestamp}_audio.msgpack"
+    legacy_audio_file = base_dir / f"{timestamp}_audio.json"
     audio_segments = []
     if audio_file.exists():
-        audio_data = load_json(audio_file)
+        audio_data = load_msgpack(audio_file)
+        audio_segments = [AudioSegment.from_dict(a) for a in audio_data['audio_segments']]
+    elif legacy_audio_file.exists():
+        audio_data = load_json(legacy_audio_file)
         audio_segments = [AudioSegment.from_dict(a) for a in audio_data['audio_segments']]
     
     # Load metadata
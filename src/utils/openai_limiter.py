@@ -0,0 +1,107 @@
+"""
+Rate limiting for OpenAI API calls.
+Keeps request and token consumption under the account's RPM/TPM ceilings so
+bursts of calls don't trip 429 responses and retry stalls.
+"""
+
+import threading
+import time
+from typing import Optional
+
+from .config import Config
+
+
+def estimate_tokens(text: str, model: Optional[str] = None) -> int:
+    """Estimate the token count of a prompt.
+
+    Uses tiktoken when available for an exact count; otherwise falls back to
+    the ~4 characters/token heuristic, which is close enough for throttling.
+    """
+    try:
+        import tiktoken
+        try:
+            encoding = tiktoken.encoding_for_model(model) if model else tiktoken.get_encoding("cl100k_base")
+        except KeyError:
+            encoding = tiktoken.get_encoding("cl100k_base")
+        return len(encoding.encode(text))
+    except ImportError:
+        return max(1, len(text) // 4)
+
+
+class RateLimiter:
+    """Leaky-bucket limiter over requests/minute and tokens/minute.
+
+    Both buckets refill continuously at their per-second rate. acquire()
+    blocks the calling thread until enough capacity is available, so callers
+    pace themselves instead of hitting 429s and backing off.
+    """
+
+    def __init__(self, max_requests_per_minute: int, max_tokens_per_minute: int):
+        """
+        Initialize rate limiter.
+
+        Args:
+            max_requests_per_minute: Request budget per minute (RPM)
+            max_tokens_per_minute: Token budget per minute (TPM)
+        """
+        self.max_requests_per_minute = max_requests_per_minute
+        self.max_tokens_per_minute = max_tokens_per_minute
+
+        self._request_capacity = float(max_requests_per_minute)
+        self._token_capacity = float(max_tokens_per_minute)
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        """Refill both buckets proportionally to elapsed time. Lock held by caller."""
+        now = time.monotonic()
+        elapsed = now - self._last_refill
+        self._last_refill = now
+
+        self._request_capacity = min(
+            float(self.max_requests_per_minute),
+            self._request_capacity + elapsed * self.max_requests_per_minute / 60.0
+        )
+        self._token_capacity = min(
+            float(self.max_tokens_per_minute),
+            self._token_capacity + elapsed * self.max_tokens_per_minute / 60.0
+        )
+
+    def acquire(self, tokens: int = 0) -> None:
+        """Block until one request plus the given token budget is available.
+
+        Args:
+            tokens: Estimated tokens this request will consume
+        """
+        tokens = min(tokens, self.max_tokens_per_minute)
+        while True:
+            with self._lock:
+                self._refill()
+                if self._request_capacity >= 1.0 and self._token_capacity >= tokens:
+                    self._request_capacity -= 1.0
+                    self._token_capacity -= tokens
+                    return
+
+                # Work out how long until both buckets have enough capacity
+                request_wait = (1.0 - self._request_capacity) * 60.0 / self.max_requests_per_minute
+                token_wait = (tokens - self._token_capacity) * 60.0 / self.max_tokens_per_minute
+                wait = max(request_wait, token_wait, 0.01)
+
+            time.sleep(wait)
+
+
+# Global rate limiter instance
+_rate_limiter: Optional[RateLimiter] = None
+_rate_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> RateLimiter:
+    """Get or create the global OpenAI rate limiter configured from Config."""
+    global _rate_limiter
+    with _rate_limiter_lock:
+        if _rate_limiter is None:
+            _rate_limiter = RateLimiter(
+                max_requests_per_minute=Config.OPENAI_MAX_RPM,
+                max_tokens_per_minute=Config.OPENAI_MAX_TPM
+            )
+        return _rate_limiter